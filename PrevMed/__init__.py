@@ -38,6 +38,17 @@ def enable_debug_console():
     )
 
 
+def enable_json_console(level: str = "INFO"):
+    """Replace console text logging with JSON records (one per line), e.g. for log collectors."""
+    global _console_handler_id
+    for handler_id in (0, _console_handler_id):
+        try:
+            logger.remove(handler_id)
+        except ValueError:
+            pass
+    _console_handler_id = logger.add(sys.stderr, level=level, serialize=True)
+
+
 from PrevMed.utils.version import __VERSION__
 
-__all__ = ["__VERSION__", "enable_debug_console"]
+__all__ = ["__VERSION__", "enable_debug_console", "enable_json_console"]
@@ -1,13 +1,193 @@
 import argparse
-import shutil
+import functools
+import hmac
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from pathlib import Path
 
-from PrevMed import enable_debug_console
+from PrevMed import enable_debug_console, enable_json_console
 from PrevMed.utils.settings import settings
-from PrevMed.utils.io import load_scoring_script
-from PrevMed.utils.gui import create_survey_interface
-from PrevMed.utils.pdf import TEMP_PDF_DIR
+
+
+def _fast_clear_dir(path: Path) -> None:
+    """
+    Supprime récursivement un répertoire et tout son contenu.
+
+    Les entrées sont énumérées avec os.scandir() puis les fichiers sont supprimés
+    en parallèle via un pool de threads, afin de recouvrir la latence des appels
+    système unlink lorsque le répertoire contient de nombreux PDF.
+
+    Paramètres
+    ----------
+    path : Path
+        Répertoire à supprimer
+    """
+    dirs = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        pending = [str(path)]
+        while pending:
+            current = pending.pop()
+            dirs.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        futures.append(executor.submit(os.unlink, entry.path))
+        # Propagate the first unlink error, if any
+        for future in futures:
+            future.result()
+
+    # Directories were collected parent-first, remove them children-first
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
+def _pid_is_alive(pid: int) -> bool:
+    """Indique si un processus de ce PID existe encore."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _sweep_stale_pdf_sessions(
+    base_dir: Path, current_dir: Path, max_age_seconds: int = 3600
+) -> None:
+    """
+    Supprime les répertoires de session PDF laissés par des lancements précédents.
+
+    Un lancement tué (SIGKILL, manque de mémoire, plantage) n'exécute pas son
+    nettoyage à l'arrêt : ses PDF temporaires, qui contiennent les réponses des
+    patients, resteraient indéfiniment. Un répertoire `session-<pid>-<horodatage>`
+    est supprimé si son processus n'existe plus, ou s'il n'a pas été modifié depuis
+    plus de max_age_seconds (durée de vie maximale des PDF temporaires).
+
+    Paramètres
+    ----------
+    base_dir : Path
+        Répertoire parent des répertoires de session
+    current_dir : Path
+        Répertoire de session du lancement en cours, jamais supprimé
+    max_age_seconds : int, optionnel
+        Âge maximal d'un répertoire de session (par défaut : 3600 secondes = 1 heure)
+    """
+    try:
+        entries = list(os.scandir(base_dir))
+    except FileNotFoundError:
+        return
+
+    now = time.time()
+    for entry in entries:
+        if not entry.name.startswith("session-") or entry.path == str(current_dir):
+            continue
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            pid = int(entry.name.split("-")[1])
+            if _pid_is_alive(pid) and now - entry.stat().st_mtime <= max_age_seconds:
+                continue
+            _fast_clear_dir(Path(entry.path))
+            logger.info(
+                "Répertoire PDF d'une session précédente supprimé: {}", entry.path
+            )
+        except (ValueError, IndexError):
+            # Not a directory created by PrevMed
+            continue
+        except OSError as e:
+            logger.warning(
+                "Échec de la suppression du répertoire PDF {}: {}", entry.path, e
+            )
+
+
+def _exit_on_signal(signum, frame) -> None:
+    """Lève SystemExit à la réception d'un signal pour que les blocs finally s'exécutent."""
+    logger.info("Main: Signal {} reçu, arrêt en cours", signal.Signals(signum).name)
+    raise SystemExit(0)
+
+
+def _make_auth_checker(username: str, password: str):
+    """
+    Construit la fonction d'authentification passée à demo.launch().
+
+    Les identifiants attendus sont encodés une seule fois, puis comparés en temps
+    constant avec hmac.compare_digest() à chaque tentative de connexion.
+
+    Paramètres
+    ----------
+    username : str
+        Nom d'utilisateur attendu
+    password : str
+        Mot de passe attendu
+
+    Retourne
+    --------
+    Callable[[str, str], bool]
+        Fonction renvoyant True si les identifiants fournis sont corrects
+    """
+    expected_user = username.encode("utf-8")
+    expected_pass = password.encode("utf-8")
+
+    def check(user: str, pwd: str) -> bool:
+        # Evaluate both comparisons so the timing does not reveal which one failed
+        user_ok = hmac.compare_digest(user.encode("utf-8"), expected_user)
+        pass_ok = hmac.compare_digest(pwd.encode("utf-8"), expected_pass)
+        return user_ok & pass_ok
+
+    return check
+
+
+def _import_rpy2() -> None:
+    """Importe les modules rpy2 utilisés par le scoring R (cible de thread)."""
+    import rpy2.robjects as ro  # noqa: F401
+    from rpy2.robjects import default_converter  # noqa: F401
+    from rpy2.robjects.conversion import localconverter  # noqa: F401
+
+
+class ConfigFileArgumentParser(argparse.ArgumentParser):
+    """
+    ArgumentParser acceptant des fichiers d'arguments préfixés par '@'.
+
+    En plus du format natif d'argparse (un argument par ligne), chaque ligne du
+    fichier peut être de la forme `cle = valeur`, où `cle` est le nom d'une option
+    avec ou sans les tirets initiaux. Une ligne contenant seulement une clé est
+    traitée comme un drapeau booléen. Les lignes vides et celles commençant par '#'
+    sont ignorées.
+    """
+
+    def convert_arg_line_to_args(self, arg_line: str) -> list[str]:
+        line = arg_line.strip()
+        if not line or line.startswith("#"):
+            return []
+
+        if "=" in line:
+            key, value = (part.strip() for part in line.split("=", 1))
+            values = [value]
+        else:
+            key, *values = line.split(None, 1)
+            # Native format: a line that is not a known option (e.g. the value
+            # following an option on the previous line) is one argument as is
+            if (
+                key not in self._option_string_actions
+                and "--" + key not in self._option_string_actions
+            ):
+                return [line]
+
+        if not key.startswith("-"):
+            key = "--" + key
+        return [key, *values]
 
 
 def parse_extra_launch_kwargs(unknown_args):
@@ -65,26 +245,31 @@ def parse_extra_launch_kwargs(unknown_args):
     return kwargs
 
 
-def cli_launcher():
-    # Clean up TEMP_PDF_DIR at startup if it exists and is non-empty
-    # This ensures we start with a clean slate and don't accumulate old temporary PDFs
-    temp_pdf_path = Path(TEMP_PDF_DIR)
-    if temp_pdf_path.exists() and any(temp_pdf_path.iterdir()):
-        logger.info(
-            f"Nettoyage du répertoire PDF temporaire au démarrage: {TEMP_PDF_DIR}"
-        )
-        try:
-            shutil.rmtree(temp_pdf_path)
-            logger.success(f"Répertoire PDF temporaire supprimé: {TEMP_PDF_DIR}")
-        except Exception as e:
-            logger.warning(f"Échec de la suppression du répertoire PDF temporaire: {e}")
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> ConfigFileArgumentParser:
+    """
+    Construit l'analyseur d'arguments de la ligne de commande.
+
+    Le résultat est mis en cache pour la durée du processus : les appels répétés
+    à cli_launcher() réutilisent le même analyseur au lieu de recréer toutes
+    les actions argparse.
 
-    parser = argparse.ArgumentParser(
+    Retourne
+    --------
+    ConfigFileArgumentParser
+        L'analyseur configuré avec toutes les options de PrevMed
+    """
+    parser = ConfigFileArgumentParser(
         description="Générateur dynamique de questionnaires à partir de configuration YAML",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars="@",
         epilog=(
             "Exemple:\n"
             "  prevmed --survey-yaml specifications.yaml --scoring-script scoring.R\n\n"
+            "Fichier d'arguments:\n"
+            "  prevmed @prod.conf\n"
+            "  où prod.conf contient une option par ligne, par ex. 'survey-yaml = specifications.yaml'\n"
+            "  ou 'save-user-data' pour un drapeau.\n\n"
             "Arguments supplémentaires:\n"
             "  Tous les arguments non reconnus seront passés à demo.launch().\n"
             "  Voir la documentation Gradio pour les arguments supportés:\n"
@@ -145,8 +330,8 @@ def cli_launcher():
     parser.add_argument(
         "--max-threads",
         type=int,
-        default=40,
-        help="Nombre maximum de threads pour le serveur Gradio (défaut: 40)",
+        default=None,
+        help="Nombre maximum de threads pour le serveur Gradio (défaut: automatique, 8 par CPU avec un minimum de 40)",
     )
     parser.add_argument(
         "--no-queue",
@@ -154,6 +339,18 @@ def cli_launcher():
         dest="queue",
         help="Désactiver la mise en file d'attente des requêtes dans Gradio (défaut: file d'attente activée)",
     )
+    parser.add_argument(
+        "--concurrency-limit",
+        type=int,
+        default=None,
+        help="Nombre maximum d'événements traités simultanément par la file d'attente Gradio (défaut: automatique, nombre de CPU borné par --max-threads)",
+    )
+    parser.add_argument(
+        "--queue-max-size",
+        type=int,
+        default=None,
+        help="Nombre maximum de requêtes en attente dans la file Gradio avant rejet (défaut: illimité)",
+    )
     parser.add_argument(
         "--umami-url",
         type=str,
@@ -166,14 +363,82 @@ def cli_launcher():
         required=False,
         help="ID du site web pour le suivi Umami analytics",
     )
+    parser.add_argument(
+        "--temp-pdf-dir",
+        type=str,
+        default=settings.temp_pdf_dir,
+        help=f"Répertoire des PDF temporaires créés pour le téléchargement lorsque --save-user-data n'est pas activé (défaut: {settings.temp_pdf_dir})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Répertoire du cache disque du YAML et du script de scoring, réutilisé entre les lancements (défaut: variable d'environnement PREVMED_FS_CACHE_DIR, sinon désactivé)",
+    )
+
+    return parser
 
+
+def cli_launcher():
+    parser = _build_parser()
     args, unknown_args = parser.parse_known_args()
 
+    # Without a terminal (containers, services), log to the console as JSON: cheaper
+    # than the colorized text format and directly usable by log collectors
+    if not sys.stderr.isatty():
+        enable_json_console(level="DEBUG" if args.debug else "INFO")
+        if args.debug:
+            logger.debug("Mode debug activé")
+    # Enable debug console logging if requested
+    elif args.debug:
+        enable_debug_console()
+        logger.debug("Mode debug activé")
+
+    # Size the worker thread pool to the host unless explicitly set, so that
+    # Gradio's 40-thread default does not become the contention point
+    if args.max_threads is None:
+        args.max_threads = max(40, (os.cpu_count() or 4) * 8)
+
+    # Read the environment at call time rather than when the cached parser was built
+    if args.cache_dir is None:
+        args.cache_dir = os.environ.get("PREVMED_FS_CACHE_DIR")
+
+    # Heavy imports (Gradio, ReportLab...) are deferred until after argument parsing
+    # so that `prevmed --help` or an invalid command line returns immediately
+    from PrevMed.utils.io import load_scoring_script
+    from PrevMed.utils.cache import cached_load
+    from PrevMed.utils.gui import create_survey_interface
+    from PrevMed.utils.pdf import ensure_private_dir
+
+    # Each launch writes its temporary PDFs to its own subdirectory, so concurrent
+    # processes do not share files and a running launch's PDFs are never wiped.
+    # Both directories are private to the current user: the PDFs hold patient answers
+    session_pdf_dir = (
+        Path(args.temp_pdf_dir) / f"session-{os.getpid()}-{int(time.time())}"
+    )
+    try:
+        ensure_private_dir(Path(args.temp_pdf_dir))
+        ensure_private_dir(session_pdf_dir)
+    except OSError as e:
+        logger.error("Répertoire des PDF temporaires inutilisable: {}", e)
+        raise SystemExit(1) from e
+    settings.temp_pdf_dir = str(session_pdf_dir)
+    logger.debug("Répertoire PDF temporaire de la session: {}", settings.temp_pdf_dir)
+
+    # Launches that were killed never ran their shutdown cleanup: remove their
+    # leftover session directories in the background, without delaying startup
+    threading.Thread(
+        target=_sweep_stale_pdf_sessions,
+        args=(Path(args.temp_pdf_dir), Path(settings.temp_pdf_dir)),
+        name="prevmed-pdf-sweep",
+        daemon=True,
+    ).start()
+
     # Parse extra kwargs for demo.launch()
     extra_launch_kwargs = parse_extra_launch_kwargs(unknown_args)
     if extra_launch_kwargs:
         logger.info(
-            f"Arguments supplémentaires pour demo.launch(): {extra_launch_kwargs}"
+            "Arguments supplémentaires pour demo.launch(): {}", extra_launch_kwargs
         )
 
     # Configure global settings
@@ -187,66 +452,104 @@ def cli_launcher():
             "Aucune donnée utilisateur ne sera sauvegardée - uniquement des PDF temporaires pour téléchargement"
         )
 
-    # Enable debug console logging if requested
-    if args.debug:
-        enable_debug_console()
-        logger.debug("Mode debug activé")
+    settings.cache_dir = args.cache_dir
+    if settings.cache_dir:
+        logger.info("Cache disque de configuration activé: {}", settings.cache_dir)
+
     survey_yaml_path = args.survey_yaml
     scoring_script_path = args.scoring_script
 
-    if not Path(survey_yaml_path).exists():
-        logger.error(f"Fichier YAML introuvable: {survey_yaml_path}")
-        raise SystemExit(f"Erreur: Fichier introuvable: {survey_yaml_path}")
-
-    if not Path(scoring_script_path).exists():
-        logger.error(f"Script de scoring introuvable: {scoring_script_path}")
-        raise SystemExit(f"Erreur: Fichier introuvable: {scoring_script_path}")
+    # Validate both input files with one stat() each, keeping the results so the
+    # disk cache key can be built without statting the files again
+    input_stats = {}
+    for label, input_path in (
+        ("Fichier YAML", survey_yaml_path),
+        ("Script de scoring", scoring_script_path),
+    ):
+        try:
+            input_stats[input_path] = os.stat(input_path)
+        except FileNotFoundError:
+            logger.error("{} introuvable: {}", label, input_path)
+            raise SystemExit(f"Erreur: Fichier introuvable: {input_path}")
 
-    logger.info(f"Main: Chargement du questionnaire depuis {survey_yaml_path}")
+    logger.info("Main: Chargement du questionnaire depuis {}", survey_yaml_path)
 
     # Load scoring script
-    scoring_language, scoring_code = load_scoring_script(scoring_script_path)
+    scoring_language, scoring_code = cached_load(
+        scoring_script_path,
+        load_scoring_script,
+        "scoring",
+        st=input_stats[scoring_script_path],
+    )
 
-    # fail early in case of R issue
+    # Check the R dependency in a background thread: importing rpy2 loads libR,
+    # which is independent from (and overlaps with) building the Gradio interface
+    rpy2_future = None
     if scoring_language == "r":
         logger.debug("Vérification de la dépendance rpy2")
-        try:
-            import rpy2.robjects as ro  # noqa: F401
-            from rpy2.robjects import default_converter  # noqa: F401
-            from rpy2.robjects.conversion import localconverter  # noqa: F401
+        rpy2_executor = ThreadPoolExecutor(max_workers=1)
+        rpy2_future = rpy2_executor.submit(_import_rpy2)
+        rpy2_executor.shutdown(wait=False)
+
+    demo = create_survey_interface(
+        yaml_path=survey_yaml_path,
+        scoring_language=scoring_language,
+        scoring_code=scoring_code,
+        actual_url=args.actual_url,
+        umami_url=args.umami_url,
+        umami_website_id=args.umami_website_id,
+    )
 
+    # fail before launch in case of R issue
+    if rpy2_future is not None:
+        try:
+            rpy2_future.result()
             logger.success("rpy2 importé avec succès")
 
         except ImportError as e:
             logger.error(
-                f"Échec de l'import de rpy2. Assurez-vous qu'il est installé correctement. L'erreur était: '{e}'"
+                "Échec de l'import de rpy2. Assurez-vous qu'il est installé correctement. L'erreur était: '{}'",
+                e,
             )
             raise Exception(
                 f"Échec de l'import de rpy2. Assurez-vous qu'il est installé correctement. L'erreur était: '{e}'"
             ) from e
 
-    demo = create_survey_interface(
-        yaml_path=survey_yaml_path,
-        scoring_language=scoring_language,
-        scoring_code=scoring_code,
-        actual_url=args.actual_url,
-        umami_url=args.umami_url,
-        umami_website_id=args.umami_website_id,
-    )
+    # Resolve authentication once, before launch()
+    auth_fn = None
+    auth_message = None
     if args.auth:
         assert "," in args.auth, "No comma found in auth argument"
         authuser, authpass = args.auth.split(",", 1)
+        auth_fn = _make_auth_checker(authuser, authpass)
+        auth_message = "Please login"
 
     # Enable request queueing if requested (enabled by default for better performance)
     if args.queue:
-        logger.info("Main: Activation de la file d'attente des requêtes")
+        # Size the concurrency limit to the host unless explicitly set
+        concurrency_limit = args.concurrency_limit
+        if concurrency_limit is None:
+            concurrency_limit = min(args.max_threads, max(2, os.cpu_count() or 4))
+        logger.info(
+            "Main: Activation de la file d'attente des requêtes (concurrence: {}, taille max: {})",
+            concurrency_limit,
+            args.queue_max_size,
+        )
         demo.queue(
-            default_concurrency_limit=10,
+            default_concurrency_limit=concurrency_limit,
+            max_size=args.queue_max_size,
         )
     else:
         logger.info("Main: File d'attente des requêtes désactivée")
 
-    logger.info("Main: Lancement de l'interface Gradio")
+    logger.info(
+        "Main: Lancement de l'interface Gradio (threads max: {})", args.max_threads
+    )
+    # SIGTERM (e.g. from a container orchestrator) would otherwise terminate the
+    # process without unwinding, skipping the temp-dir cleanup below
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _exit_on_signal)
+
     # relevant docs: https://www.gradio.app/docs/gradio/blocks
     try:
         demo.launch(
@@ -262,26 +565,26 @@ def cli_launcher():
             pwa=False,
             mcp_server=False,
             # ssr_mode=True,  # server side rendering, experimental, trouble exiting at least
-            auth=[(authuser, authpass)] if args.auth else None,
-            auth_message="Please login" if args.auth else None,
+            auth=auth_fn,
+            auth_message=auth_message,
             server_name=args.server_name,
             server_port=args.port,
             **extra_launch_kwargs,
         )
     finally:
-        # Clean up TEMP_PDF_DIR at shutdown if it exists
+        # Clean up this launch's temporary PDF directory at shutdown if it exists
         # This ensures temporary PDFs don't persist after the application closes
-        temp_pdf_path = Path(TEMP_PDF_DIR)
+        temp_pdf_path = Path(settings.temp_pdf_dir)
         if temp_pdf_path.exists():
             logger.info(
-                f"Nettoyage du répertoire PDF temporaire à l'arrêt: {TEMP_PDF_DIR}"
+                "Nettoyage du répertoire PDF temporaire à l'arrêt: {}", temp_pdf_path
             )
             try:
-                shutil.rmtree(temp_pdf_path)
-                logger.success(f"Répertoire PDF temporaire supprimé: {TEMP_PDF_DIR}")
+                _fast_clear_dir(temp_pdf_path)
+                logger.success("Répertoire PDF temporaire supprimé: {}", temp_pdf_path)
             except Exception as e:
                 logger.warning(
-                    f"Échec de la suppression du répertoire PDF temporaire: {e}"
+                    "Échec de la suppression du répertoire PDF temporaire: {}", e
                 )
 
     logger.info("Main: Interface Gradio fermée")
@@ -0,0 +1,99 @@
+"""
+Cache disque des fichiers de configuration pour PrevMed.
+
+Permet de conserver entre deux lancements le résultat du chargement du YAML du
+questionnaire et du script de scoring. La clé de cache dépend du chemin absolu,
+de la date de modification et de la taille du fichier et de la version de PrevMed :
+toute modification du fichier source invalide automatiquement l'entrée, et les
+entrées remplacées pour un même fichier sont supprimées.
+
+Le cache est désactivé par défaut ; il est activé en renseignant
+`settings.cache_dir` (option CLI --cache-dir ou variable d'environnement
+PREVMED_FS_CACHE_DIR).
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable
+from filelock import FileLock
+from loguru import logger
+
+from PrevMed.utils.settings import settings
+from PrevMed.utils.version import __VERSION__
+
+
+def cached_load(
+    filepath: str,
+    loader: Callable[[str], Any],
+    namespace: str,
+    st: os.stat_result | None = None,
+) -> Any:
+    """
+    Charge un fichier via `loader` en passant par le cache disque si celui-ci est activé.
+
+    Paramètres
+    ----------
+    filepath : str
+        Chemin vers le fichier source
+    loader : Callable[[str], Any]
+        Fonction de chargement appelée en cas d'absence dans le cache
+    namespace : str
+        Préfixe distinguant les différents types de contenus mis en cache (ex: 'yaml')
+    st : os.stat_result, optionnel
+        Résultat d'un os.stat() déjà effectué sur `filepath`, réutilisé pour la clé de cache
+
+    Retourne
+    --------
+    Any
+        Résultat de `loader(filepath)`, éventuellement lu depuis le cache
+    """
+    if not settings.cache_dir:
+        return loader(filepath)
+
+    if st is None:
+        st = os.stat(filepath)
+    # The file name is "<source key>-<content key>": the first part identifies the
+    # source file, the second its state, so that superseded entries can be found.
+    # The size is part of the state since mtimes can be coarse or reset in containers
+    source_key = hashlib.blake2b(
+        f"{namespace}:{os.path.abspath(filepath)}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    content_key = hashlib.blake2b(
+        f"{__VERSION__}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    cache_dir = Path(settings.cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{source_key}-{content_key}.pkl"
+
+    # Lock the source file's entries so that concurrent launches don't read a
+    # half-written pickle. The lock is named after the source only, so that editing
+    # the file doesn't leave a new lock file behind for each of its versions
+    with FileLock(str(cache_dir / f"{source_key}.lock"), timeout=10):
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    value = pickle.load(f)
+                logger.debug(f"Cache disque utilisé pour {filepath} ({namespace})")
+                return value
+            except Exception as e:
+                logger.warning(
+                    f"Entrée de cache illisible pour {filepath}, ignorée: {e}"
+                )
+
+        value = loader(filepath)
+
+        temp_file = cache_file.with_suffix(".pkl.tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_file.replace(cache_file)
+        logger.debug(f"Entrée de cache disque écrite pour {filepath} ({namespace})")
+
+        # Remove the entries of previous versions of this file
+        for stale_file in cache_dir.glob(f"{source_key}-*.pkl"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+
+    return value
@@ -1,3 +1,13 @@
+import atexit
+import functools
+import hashlib
+import re
+import shutil
+import tempfile
+from pathlib import Path
+import gradio as gr
+
+
 CSS = """
 .question-row {
     justify-content: center !important;
@@ -33,7 +43,7 @@ CSS = """
     text-align: center !important;
 }
 
-// Display the result table in the middle
+/* Display the result table in the middle */
 .adjusted-results {
     display: flex;
     justify-content: center;
@@ -44,8 +54,51 @@ CSS = """
     margin-right: auto;
 }
 
-// hide the footer
+/* hide the footer */
 footer {
     display: none !important;
 }
 """
+
+# Strip comments and collapse whitespace once at import time so that fewer bytes
+# are embedded in every page served by Gradio
+CSS = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", CSS, flags=re.S)).strip()
+CSS_UTF8 = CSS.encode("utf-8")
+
+
+@functools.cache
+def _css_static_dir() -> Path:
+    """Crée (une fois par processus) le répertoire privé du fichier CSS servi par Gradio."""
+    # mkdtemp creates an unpredictable directory readable by the current user only,
+    # so no other local user can plant or replace the served stylesheet
+    static_dir = Path(tempfile.mkdtemp(prefix="prevmed-static-"))
+    atexit.register(shutil.rmtree, static_dir, ignore_errors=True)
+    return static_dir
+
+
+def write_css_asset() -> str:
+    """
+    Écrit CSS dans un fichier statique servi par Gradio et retourne la balise <link> correspondante.
+
+    Le nom du fichier contient un hash de son contenu : le navigateur peut donc le
+    garder en cache d'une page à l'autre, et toute modification du CSS produit une
+    nouvelle URL. La balise retournée est destinée au paramètre `head` de gr.Blocks,
+    à la place de `css=CSS` qui intègre la feuille de style dans chaque page.
+
+    Retourne
+    --------
+    str
+        Balise <link rel="stylesheet"> pointant vers le fichier CSS
+    """
+    digest = hashlib.sha256(CSS_UTF8).hexdigest()[:16]
+    css_path = _css_static_dir() / f"prevmed-{digest}.css"
+    # Always (re)write the file, to a temporary name renamed into place, so that a
+    # page being served never sees a partial stylesheet
+    temp_path = css_path.with_suffix(".css.tmp")
+    temp_path.write_bytes(CSS_UTF8)
+    temp_path.replace(css_path)
+
+    # Only this file is exposed by Gradio, not the directory holding it
+    gr.set_static_paths(paths=[css_path])
+    # Relative URL so that the link still works when the app is mounted under a sub-path
+    return f'<link rel="stylesheet" href="gradio_api/file={css_path.as_posix()}">'
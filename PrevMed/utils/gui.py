@@ -1,21 +1,99 @@
+import functools
+import hashlib
+import json
 import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import gradio as gr
 from typing import Any, Dict
 from loguru import logger
 
 from PrevMed.utils.io import load_yaml
+from PrevMed.utils.cache import cached_load
 from PrevMed.utils.scoring import execute_scoring
 from PrevMed.utils.logic import (
-    find_next_valid_question,
-    evaluate_skip_if,
-    evaluate_valid_if,
+    build_skip_table,
+    compile_skip_all,
+    compile_skip_if,
+    compile_valid_if,
+    condition_variables,
 )
 from PrevMed.utils.pdf import generate_pdf_report
+from PrevMed.utils.settings import settings
 from PrevMed.utils.version import __VERSION__
-from PrevMed.utils.css import CSS
+from PrevMed.utils.css import write_css_asset
 from PrevMed.utils.js import JS_HEAD
 
+# Maximum number of completed surveys whose result and PDF are kept for reuse
+COMPLETED_RESULTS_CACHE_SIZE = 256
+
+# PDF reports are rendered in the background so the scoring result is shown right away
+PDF_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="prevmed-pdf")
+
+# CSS classes of the question rows; the row of the current question is tagged so that
+# the page script can scroll to it without probing every row
+QUESTION_ROW_CLASSES = ["question-row"]
+ACTIVE_QUESTION_ROW_CLASSES = ["question-row", "active-question"]
+
+# Theme shared by every survey interface
+SURVEY_THEME = gr.themes.Soft(
+    primary_hue="green",
+    secondary_hue="emerald",
+    neutral_hue="gray",
+)
+
+# Gradio component classes of the explicitly supported widget types
+WIDGET_CLASSES = {
+    "Radio": gr.Radio,
+    "Slider": gr.Slider,
+    "Number": gr.Number,
+    "Checkbox": gr.Checkbox,
+    "Textbox": gr.Textbox,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def build_head(umami_url: str | None, umami_website_id: str | None) -> str:
+    """
+    Construit le contenu HTML <head> de l'interface (analytics Umami optionnel et JavaScript).
+
+    Le résultat ne dépend que des paramètres Umami et est mis en cache.
+
+    Paramètres
+    ----------
+    umami_url : str | None
+        URL de l'instance Umami analytics
+    umami_website_id : str | None
+        ID du site web pour le suivi Umami analytics
+
+    Retourne
+    --------
+    str
+        Contenu HTML à injecter dans le <head> de la page
+    """
+    # Build analytics head content if parameters are provided
+    # This allows optional Umami analytics integration for usage tracking
+    analytics_head = ""
+
+    if umami_url and umami_website_id:
+        # Use custom Umami instance URL if provided, otherwise use cloud default
+        script_url = f"{umami_url}/script.js"
+        analytics_head = f'<script defer src="{script_url}" data-website-id="{umami_website_id}"></script>\n'
+        logger.info(
+            f"Umami analytics activé: {script_url} (ID du site web: {umami_website_id})"
+        )
+    elif umami_website_id:
+        # Only website ID provided, use cloud.umami.is default
+        analytics_head = f'<script defer src="https://cloud.umami.is/script.js" data-website-id="{umami_website_id}"></script>\n'
+        logger.info(
+            f"Umami analytics activé avec le point d'accès cloud (ID du site web: {umami_website_id})"
+        )
+    else:
+        logger.debug("Umami analytics non configuré (aucun argument fourni)")
+
+    return analytics_head + "\n\n" + JS_HEAD
+
 
 def create_widget_for_question(question: Dict[str, Any]) -> gr.components.Component:
     """
@@ -60,19 +138,12 @@ def create_widget_for_question(question: Dict[str, Any]) -> gr.components.Compon
 
     logger.debug(f"  Widget kwargs (valeur exclue): {kwargs}")
 
-    if widget_type == "Radio":
-        widget = gr.Radio(**kwargs)
-    elif widget_type == "Slider":
-        widget = gr.Slider(**kwargs)
-    elif widget_type == "Number":
+    if widget_type == "Number":
         # Number widget always uses integer precision in this application
         kwargs["precision"] = 0
-        widget = gr.Number(**kwargs)
-    elif widget_type == "Checkbox":
-        widget = gr.Checkbox(**kwargs)
-    elif widget_type == "Textbox":
-        widget = gr.Textbox(**kwargs)
-    else:
+
+    widget_class = WIDGET_CLASSES.get(widget_type)
+    if widget_class is None:
         # Check if widget_type is a valid Gradio component we haven't explicitly handled
         if hasattr(gr, widget_type):
             logger.warning(
@@ -80,13 +151,13 @@ def create_widget_for_question(question: Dict[str, Any]) -> gr.components.Compon
                 f"mais existe dans Gradio. Tentative d'utilisation quand même."
             )
             widget_class = getattr(gr, widget_type)
-            widget = widget_class(**kwargs)
         else:
             # Fallback to Textbox for unknown widget types
             logger.warning(
                 f"Type de widget inconnu '{widget_type}' pour la variable '{variable}', utilisation de Textbox"
             )
-            widget = gr.Textbox(**kwargs)
+            widget_class = gr.Textbox
+    widget = widget_class(**kwargs)
 
     logger.debug(f"Widget {widget_type} créé avec succès pour la variable '{variable}'")
     return widget
@@ -125,45 +196,89 @@ def create_survey_interface(
     """
     logger.info(f"Création de l'interface du questionnaire depuis le YAML: {yaml_path}")
 
-    config = load_yaml(yaml_path)
+    config = cached_load(yaml_path, load_yaml, "yaml")
     questions = sorted(config["questions"], key=lambda q: q["order"])
 
+    # Compile skip_if/valid_if expressions once, so navigation clicks only run bytecode
+    for q in questions:
+        q["_skip_fn"] = compile_skip_if(q["skip_if"]) if "skip_if" in q else None
+        q["_valid_fn"] = compile_valid_if(q["valid_if"]) if "valid_if" in q else None
+
+    # Per-question metadata as parallel lists indexed like `questions`, so the
+    # navigation handlers index lists instead of looking up question dicts
+    variables = [q["variable"] for q in questions]
+    # All skip_if conditions evaluated by a single compiled expression
+    skip_all = compile_skip_all([q.get("skip_if") for q in questions])
+    valid_fns = [q["_valid_fn"] for q in questions]
+    has_default = ["default" in q.get("widget_args", {}) for q in questions]
+
+    # Only the answers referenced by a skip_if condition determine which questions are
+    # skipped, so the skip table is memoized on the values of these "gating" variables
+    referenced = set()
+    for q in questions:
+        if "skip_if" in q:
+            referenced |= condition_variables(q["skip_if"])
+    gating_vars = [v for v in variables if v in referenced]
+    # Without any skip_if every question is shown, so navigation is a plain +1/-1 and
+    # the handlers do not need to build a context for it
+    has_any_skip_if = any("skip_if" in q for q in questions)
+
+    # (session, answers) hash -> (markdown result, PDF path) of completed surveys, so
+    # that going back and finishing again with the same answers reuses the report
+    completed_results: Dict[str, tuple[str, str]] = {}
+    completed_results_lock = threading.Lock()
+    # Session hash -> future of the PDF report being rendered for that session,
+    # collected by collect_pdf right after the go_next click that submitted it
+    pending_pdfs: Dict[str, Future] = {}
+    pending_pdfs_lock = threading.Lock()
+
+    @functools.lru_cache(maxsize=128)
+    def cached_skip_table(signature):
+        gating_context = {v: value for v, (_, value) in zip(gating_vars, signature)}
+        return build_skip_table(skip_all, gating_context)
+
+    def get_skip_table(context):
+        # The value type is part of the key since e.g. 0, 0.0 and False compare equal
+        signature = tuple((type(context[v]), context[v]) for v in gating_vars)
+        try:
+            hash(signature)
+        except TypeError:
+            # Unhashable answers (e.g. lists from multi-choice widgets) bypass the memo
+            return build_skip_table(skip_all, context)
+        return cached_skip_table(signature)
+
+    # Same memoization for valid_if, keyed on the answers each condition references,
+    # so repeated clicks with unchanged answers do not evaluate the condition again
+    valid_vars = []
+    for q in questions:
+        # Each condition is parsed once, not once per survey variable
+        refs = condition_variables(q["valid_if"]) if "valid_if" in q else set()
+        valid_vars.append([v for v in variables if v in refs])
+
+    @functools.lru_cache(maxsize=256)
+    def cached_is_valid(idx, signature):
+        valid_context = {v: value for v, (_, value) in zip(valid_vars[idx], signature)}
+        return valid_fns[idx](valid_context)
+
+    def is_answer_valid(idx, context):
+        signature = tuple((type(context[v]), context[v]) for v in valid_vars[idx])
+        try:
+            hash(signature)
+        except TypeError:
+            return valid_fns[idx](context)
+        return cached_is_valid(idx, signature)
+
     logger.info(
         f"Questionnaire '{config['survey_name']}' chargé avec {len(questions)} questions"
     )
 
     logger.info(f"Langage de scoring: {scoring_language}")
 
-    # Build analytics head content if parameters are provided
-    # This allows optional Umami analytics integration for usage tracking
-    analytics_head = ""
-
-    if umami_url and umami_website_id:
-        # Use custom Umami instance URL if provided, otherwise use cloud default
-        script_url = f"{umami_url}/script.js"
-        analytics_head = f'<script defer src="{script_url}" data-website-id="{umami_website_id}"></script>\n'
-        logger.info(
-            f"Umami analytics activé: {script_url} (ID du site web: {umami_website_id})"
-        )
-    elif umami_website_id:
-        # Only website ID provided, use cloud.umami.is default
-        analytics_head = f'<script defer src="https://cloud.umami.is/script.js" data-website-id="{umami_website_id}"></script>\n'
-        logger.info(
-            f"Umami analytics activé avec le point d'accès cloud (ID du site web: {umami_website_id})"
-        )
-    else:
-        logger.debug("Umami analytics non configuré (aucun argument fourni)")
-
     with gr.Blocks(
         title=config["survey_name"],
-        theme=gr.themes.Soft(
-            primary_hue="green",
-            secondary_hue="emerald",
-            neutral_hue="gray",
-        ),
+        theme=SURVEY_THEME,
         analytics_enabled=False,
-        head=analytics_head + "\n\n" + JS_HEAD,
-        css=CSS,
+        head=build_head(umami_url, umami_website_id) + "\n" + write_css_asset(),
     ) as demo:
         gr.Markdown(
             f"# PrevMed - {config['survey_name']} (v{config['survey_version']})"
@@ -176,25 +291,26 @@ def create_survey_interface(
 
         # State to track current question index
         current_question_idx = gr.State(0)
+        # State holding the (visible, interactive) pair last sent for each question,
+        # so that display updates only include the rows that actually change
+        row_states = gr.State(None)
 
         # Container for questions with accumulative display
         # All answered questions remain visible as user progresses
         with gr.Column(elem_classes=["question-container", "adjusted-widgets"]):
-            # Create all widgets and store them
+            # Create all widgets in question order; these two lists are built once and
+            # shared by the handlers and the event wiring
             # First question is visible by default, rest are hidden
-            widgets = {}
+            rows = []
+            widget_components = []
             for i, q in enumerate(questions):
                 # First question's row starts visible so users see something immediately
                 initial_visible = i == 0
                 with gr.Row(
-                    visible=initial_visible, elem_classes=["question-row"]
+                    visible=initial_visible, elem_classes=QUESTION_ROW_CLASSES
                 ) as row:
-                    widget = create_widget_for_question(q)
-                    widgets[q["variable"]] = {
-                        "widget": widget,
-                        "row": row,
-                        "question": q,
-                    }
+                    widget_components.append(create_widget_for_question(q))
+                rows.append(row)
 
         # Navigation buttons with fixed positioning class
         with gr.Row(elem_classes="nav-buttons", equal_height=True):
@@ -203,6 +319,7 @@ def create_survey_interface(
                 f"Suivant → (Question 1 / {len(questions)})",
                 variant="primary",
                 scale=2,
+                elem_id="prevmed-next-btn",
             )
 
         # Results section - positioned at bottom to appear after answering questions
@@ -213,6 +330,7 @@ def create_survey_interface(
                 visible=False,
                 variant="primary",
                 size="lg",
+                elem_id="prevmed-pdf-btn",
             )
         error_output = gr.Textbox(label="Erreur", visible=False, interactive=False)
 
@@ -221,7 +339,7 @@ def create_survey_interface(
             "🔄 Recharger le questionnaire", variant="secondary", size="sm"
         )
 
-        def update_question_display(current_idx, *args):
+        def update_question_display(current_idx, previous_states, *args, context=None):
             """
             Met à jour quelles questions sont visibles en fonction de l'index actuel.
 
@@ -229,69 +347,60 @@ def create_survey_interface(
             restent visibles si leurs conditions sont remplies, tandis que les questions futures sont cachées.
             Seule la question actuelle est interactive ; les précédentes sont en lecture seule.
 
-            Scalabilité : Met à jour uniquement les questions de 0 à current_idx+1, pas toutes les questions.
+            Scalabilité : seules les questions dont la visibilité ou l'interactivité change par
+            rapport au dernier affichage envoyé sont mises à jour, pas toutes les questions.
 
             Paramètres
             ----------
             current_idx : int
                 Index de la question actuelle à afficher
+            previous_states : list[tuple[bool, bool]] | None
+                Paires (visible, interactive) envoyées lors du dernier affichage, ou None
+                si aucun affichage n'a encore été envoyé (toutes les questions sont alors mises à jour)
             *args : tuple
                 Valeurs des widgets de toutes les questions dans l'ordre
+            context : Dict[str, Any], optionnel
+                Contexte {variable: valeur} déjà construit par l'appelant à partir de args ;
+                construit ici s'il n'est pas fourni
 
             Retourne
             --------
-            Dict[gr.components.Component, gr.update]
-                Dictionnaire de mises à jour des composants Gradio
+            list
+                Mises à jour alignées sur display_outputs : lignes des questions, widgets,
+                boutons Précédent/Suivant, index de la question et états des lignes
             """
             logger.debug(
-                f"=== update_question_display DÉBUT === current_idx={current_idx}"
+                "=== update_question_display DÉBUT === current_idx={}", current_idx
             )
-            logger.debug(f"Réception de {len(args)} arguments")
+            logger.debug("Réception de {} arguments", len(args))
 
-            # Build context from current values
-            context = {}
-            for i, q in enumerate(questions):
-                context[q["variable"]] = args[i]
-                # Anonymity: Do not log actual answer values, only variable name and type
-                logger.debug(
-                    f"  Context[{i}] '{q['variable']}' (widget: {q['widget']}) type: {type(args[i]).__name__}"
-                )
+            if has_any_skip_if:
+                # Build context from current values unless the caller already did
+                if context is None:
+                    context = dict(zip(variables, args))
+                    logger.debug("Contexte construit avec {} variables", len(context))
 
-            logger.debug(f"Contexte construit avec {len(context)} variables")
+                # Skip state of every question for this context (memoized on the gating
+                # answers), reused below for the displayed question, the row updates and the progress
+                skipped, next_valid, _prev_valid = get_skip_table(context)
+            else:
+                skipped = None
 
             # Find the actual question to display (considering conditions)
             display_idx = current_idx
-            while 0 <= display_idx < len(questions):
-                condition = questions[display_idx].get("skip_if", None)
-                if not condition:
-                    break
-                elif not evaluate_skip_if(condition, context):
-                    break
-                # If condition not met, skip to next question
-                display_idx += 1
-
-            # Build dictionary of component updates
-            # Scalability: Only update components in a narrow range around current index
-            # This avoids updating all previous questions, significantly improving performance
-            # We only need to update:
-            # - Previous question (to make it non-interactive)
-            # - Current question (to make it visible and interactive)
-            # - Next question (to ensure it stays hidden)
-            updates = {}
-
-            start_idx = max(0, display_idx - 1)
-            end_idx = len(questions)  # Always update to end to hide future questions
-            logger.debug(
-                f"Mise à jour des questions {start_idx} à {end_idx - 1} (plage de {end_idx - start_idx}) sur {len(questions)} au total"
-            )
+            if skipped is not None and 0 <= display_idx < len(questions):
+                display_idx = next_valid[display_idx]
 
-            for i in range(start_idx, end_idx):
-                q = questions[i]
-                condition = q.get("skip_if", None)
-                if not condition:
-                    is_condition_met = True
-                else:
-                    is_condition_met = not evaluate_skip_if(condition, context)
+            # Build the list of component updates, in display_outputs order
+            # Scalability: only rows whose (visible, interactive) state differs from the
+            # one last sent to this client are updated, which keeps the payload small
+            n_questions = len(questions)
+            updates = [gr.update() for _ in range(2 * n_questions)]
+            changed_count = 0
+
+            states = []
+            for i in range(len(questions)):
+                is_condition_met = skipped is None or not skipped[i]
 
                 if i <= current_idx:
                     # Current and previous questions: show if condition is met
@@ -303,14 +412,33 @@ def create_survey_interface(
                     # Future questions: always hide and non-interactive
                     is_visible = False
                     is_interactive = False
+                states.append((is_visible, is_interactive))
+
+                if previous_states is not None and previous_states[i] == states[i]:
+                    continue
 
-                # Update row visibility
-                updates[widgets[q["variable"]]["row"]] = gr.update(visible=is_visible)
-                # Update widget interactivity and value
-                # Must include value when updating interactive to ensure proper state update
-                updates[widgets[q["variable"]]["widget"]] = gr.update(
-                    interactive=is_interactive, value=args[i]
+                # Update row visibility, and tag the row of the current question
+                updates[i] = gr.update(
+                    visible=is_visible,
+                    elem_classes=ACTIVE_QUESTION_ROW_CLASSES
+                    if is_interactive
+                    else QUESTION_ROW_CLASSES,
                 )
+                # Update widget interactivity; the answer is only echoed back for the
+                # question becoming current, the other widgets keep their client-side value
+                if i == display_idx:
+                    updates[n_questions + i] = gr.update(
+                        interactive=is_interactive, value=args[i]
+                    )
+                else:
+                    updates[n_questions + i] = gr.update(interactive=is_interactive)
+                changed_count += 1
+
+            logger.debug(
+                "Mise à jour de {} questions sur {} au total",
+                changed_count,
+                n_questions,
+            )
 
             # Update navigation buttons
             # Hide both buttons when showing results (past last question)
@@ -322,19 +450,15 @@ def create_survey_interface(
             # A question is valid (should be shown) if:
             # - It has no skip_if condition, OR
             # - It has skip_if but the condition evaluates to False (don't skip)
-            total_valid = sum(
-                1
-                for q in questions
-                if ("skip_if" not in q) or (not evaluate_skip_if(q["skip_if"], context))
-            )
-
             # Count which valid question we're on (questions up to and including current)
             # Uses same logic as total_valid for consistency
-            current_valid = sum(
-                1
-                for i, q in enumerate(questions[: display_idx + 1])
-                if ("skip_if" not in q) or (not evaluate_skip_if(q["skip_if"], context))
-            )
+            shown_count = min(display_idx + 1, len(questions))
+            if skipped is None:
+                total_valid = len(questions)
+                current_valid = shown_count
+            else:
+                total_valid = len(questions) - sum(skipped)
+                current_valid = shown_count - sum(skipped[:shown_count])
 
             # Calculate progress text for button label
             if display_idx < len(questions):
@@ -348,22 +472,27 @@ def create_survey_interface(
                 next_btn_label = "✓ Terminé"
 
             logger.debug(
-                f"Index d'affichage: {display_idx}, Progression: {current_valid}/{total_valid}"
+                "Index d'affichage: {}, Progression: {}/{}",
+                display_idx,
+                current_valid,
+                total_valid,
             )
 
             # Add navigation button updates
-            updates[prev_btn] = gr.update(visible=prev_visible)
-            updates[next_btn] = gr.update(visible=next_visible, value=next_btn_label)
+            updates.append(gr.update(visible=prev_visible))
+            updates.append(gr.update(visible=next_visible, value=next_btn_label))
             # State update for current question index
-            updates[current_question_idx] = display_idx
+            updates.append(display_idx)
+            updates.append(states)
 
             logger.debug(
-                f"=== update_question_display FIN === Retour de {len(updates)} mises à jour de composants"
+                "=== update_question_display FIN === Retour de {} mises à jour de composants",
+                changed_count * 2 + 4,
             )
 
             return updates
 
-        def go_next(request: gr.Request, current_idx, *args):
+        def go_next(request: gr.Request, current_idx, previous_states, *args):
             """
             Navigue vers la question suivante, en sautant celles dont les conditions ne sont pas remplies.
 
@@ -373,29 +502,32 @@ def create_survey_interface(
                 Objet de requête Gradio contenant les informations client
             current_idx : int
                 Index de la question actuelle
+            previous_states : list[tuple[bool, bool]] | None
+                Paires (visible, interactive) du dernier affichage (voir update_question_display)
             *args : tuple
                 Valeurs des widgets de toutes les questions dans l'ordre
 
             Retourne
             --------
-            Dict[gr.components.Component, gr.update]
-                Dictionnaire de mises à jour des composants Gradio incluant la navigation
-                et potentiellement les résultats si c'est la dernière question
+            list
+                Mises à jour alignées sur next_outputs : celles de update_question_display
+                suivies des composants de résultats (affichés si c'est la dernière question)
             """
             logger.info(
-                f"=== go_next DÉBUT === depuis l'index de question {current_idx}"
+                "=== go_next DÉBUT === depuis l'index de question {}", current_idx
             )
-            logger.debug(f"go_next a reçu {len(args)} arguments")
+            logger.debug("go_next a reçu {} arguments", len(args))
+
+            # Build context from current values once for validation, navigation and display
+            context = dict(zip(variables, args))
 
             # Check if current question has been answered
             # Only enforce this if the question doesn't have a default value
             current_value = args[current_idx]
             current_question = questions[current_idx]
-            widget_args = current_question.get("widget_args", {})
-            has_default = "default" in widget_args
 
             # If no default is specified, require the user to provide a value
-            if not has_default:
+            if not has_default[current_idx]:
                 # Check if value is None or empty (for text inputs)
                 # Note: False and 0 are valid values, so we specifically check for None
                 is_empty = current_value is None or (
@@ -405,36 +537,41 @@ def create_survey_interface(
                 if is_empty:
                     warning_msg = f"Veuillez répondre à la question actuelle avant de continuer: {current_question['question']}"
                     logger.warning(
-                        f"L'utilisateur a tenté de continuer sans répondre à la question {current_idx}: {current_question['variable']}"
+                        "L'utilisateur a tenté de continuer sans répondre à la question {}: {}",
+                        current_idx,
+                        current_question["variable"],
                     )
 
                     # Display warning using Gradio's built-in Warning notification
                     gr.Warning(warning_msg)
 
                     # Return updates that don't change question
-                    updates = update_question_display(current_idx, *args)
-                    return updates
+                    updates = update_question_display(
+                        current_idx, previous_states, *args, context=context
+                    )
+                    # Leave the result components unchanged
+                    return updates + [gr.update(), gr.update(), gr.update()]
 
             # Check if answer meets validation criteria (valid_if condition)
-            if "valid_if" in current_question:
-                # Build context from current values for validation
-                context = {}
-                for i, q in enumerate(questions):
-                    context[q["variable"]] = args[i]
-
+            valid_fn = valid_fns[current_idx]
+            if valid_fn is not None:
                 valid_if_condition = current_question["valid_if"]
 
                 # Evaluate the valid_if condition
                 try:
-                    is_valid = evaluate_valid_if(valid_if_condition, context)
+                    is_valid = is_answer_valid(current_idx, context)
                 except Exception as e:
                     logger.error(
-                        f"Erreur lors de l'évaluation de la condition valid_if: {str(e)}",
+                        "Erreur lors de l'évaluation de la condition valid_if: {}",
+                        str(e),
                         exc_info=True,
                     )
                     gr.Warning(f"Erreur lors de la validation: {str(e)}")
-                    updates = update_question_display(current_idx, *args)
-                    return updates
+                    updates = update_question_display(
+                        current_idx, previous_states, *args, context=context
+                    )
+                    # Leave the result components unchanged
+                    return updates + [gr.update(), gr.update(), gr.update()]
 
                 if not is_valid:
                     # Use custom invalid_message if provided, otherwise use default
@@ -444,16 +581,22 @@ def create_survey_interface(
                         warning_msg = f"La réponse à la question actuelle n'est pas valide: {current_question['question']}"
 
                     logger.warning(
-                        f"L'utilisateur a fourni une réponse invalide pour la question {current_idx}: {current_question['variable']} "
-                        f"(la condition valid_if '{valid_if_condition}' a été évaluée à False)"
+                        "L'utilisateur a fourni une réponse invalide pour la question {}: {} "
+                        "(la condition valid_if '{}' a été évaluée à False)",
+                        current_idx,
+                        current_question["variable"],
+                        valid_if_condition,
                     )
 
                     # Display warning using Gradio's built-in Warning notification
                     gr.Warning(warning_msg)
 
                     # Return updates that don't change question
-                    updates = update_question_display(current_idx, *args)
-                    return updates
+                    updates = update_question_display(
+                        current_idx, previous_states, *args, context=context
+                    )
+                    # Leave the result components unchanged
+                    return updates + [gr.update(), gr.update(), gr.update()]
 
             # Capture client info from request for privacy-preserving hash
             # This will be hashed with the patient reference code as salt
@@ -469,54 +612,50 @@ def create_survey_interface(
                         "session_hash": request.session_hash,
                     }
                     logger.info(
-                        f"Informations client capturées pour le hachage: IP={client_info['ip_address']}, session_hash={client_info['session_hash']}"
+                        "Informations client capturées pour le hachage: IP={}, session_hash={}",
+                        client_info["ip_address"],
+                        client_info["session_hash"],
                     )
                 except Exception as e:
-                    logger.warning(f"Échec de la capture des informations client: {e}")
+                    logger.warning("Échec de la capture des informations client: {}", e)
                     client_info = None
             else:
                 logger.warning(
                     "L'objet Request est None - le client_hash ne sera pas généré"
                 )
 
-            # Log argument metadata (anonymity: do not log actual values)
-            for i, (q, val) in enumerate(zip(questions, args)):
-                logger.debug(
-                    f"  go_next entrée[{i}] '{q['variable']}' (widget:{q['widget']}) type: {type(val).__name__}"
-                )
-
-            # Build context from current values
-            context = {}
-            for i, q in enumerate(questions):
-                context[q["variable"]] = args[i]
-
             logger.debug(
-                f"Recherche de la prochaine question valide depuis {current_idx}"
+                "Recherche de la prochaine question valide depuis {}", current_idx
             )
             try:
-                new_idx = find_next_valid_question(
-                    current_idx, questions, context, direction=1
-                )
-                logger.debug(f"Index de la prochaine question valide: {new_idx}")
+                new_idx = min(current_idx + 1, len(questions))
+                if has_any_skip_if:
+                    _skipped, next_valid, _prev_valid = get_skip_table(context)
+                    new_idx = next_valid[new_idx]
+                logger.debug("Index de la prochaine question valide: {}", new_idx)
             except Exception as e:
                 logger.error(
-                    f"Erreur lors de la recherche de la question suivante: {str(e)}",
+                    "Erreur lors de la recherche de la question suivante: {}",
+                    str(e),
                     exc_info=True,
                 )
                 raise
 
-            logger.debug(f"Navigation de l'index {current_idx} vers {new_idx}")
+            logger.debug("Navigation de l'index {} vers {}", current_idx, new_idx)
 
             # Get display updates as dictionary
-            logger.debug(f"Appel de update_question_display avec new_idx={new_idx}")
+            logger.debug("Appel de update_question_display avec new_idx={}", new_idx)
             try:
-                updates = update_question_display(new_idx, *args)
+                updates = update_question_display(
+                    new_idx, previous_states, *args, context=context
+                )
                 logger.debug(
-                    f"Réception de {len(updates)} mises à jour de composants depuis update_question_display"
+                    "Réception de {} mises à jour de composants depuis update_question_display",
+                    len(updates),
                 )
             except Exception as e:
                 logger.error(
-                    f"ERREUR dans update_question_display: {str(e)}", exc_info=True
+                    "ERREUR dans update_question_display: {}", str(e), exc_info=True
                 )
                 raise
 
@@ -524,70 +663,172 @@ def create_survey_interface(
             if new_idx >= len(questions):
                 logger.info("=== Fin du questionnaire atteinte, calcul du score ===")
                 # Map values to inputs dict
-                inputs = {}
-                for i, q in enumerate(questions):
-                    inputs[q["variable"]] = args[i]
+                inputs = dict(zip(variables, args))
+
+                # Completed surveys are only reused within the same session, since the
+                # report carries a per-user reference code and client hash; when user data
+                # is saved, every completion is generated and logged
+                result_key = None
+                if request is not None and not settings.save_user_data:
+                    result_key = hashlib.blake2b(
+                        json.dumps(
+                            [request.session_hash, inputs], sort_keys=True, default=str
+                        ).encode("utf-8")
+                    ).hexdigest()
+                cached_result = completed_results.get(result_key)
 
                 logger.debug("Exécution de la fonction de scoring")
                 try:
-                    scoring_start = time.perf_counter()
-                    markdown_result, result_data, pdf_options = execute_scoring(
-                        scoring_language, scoring_code, inputs
-                    )
-                    scoring_duration = time.perf_counter() - scoring_start
-                    logger.success(
-                        f"Scoring complété avec succès en {scoring_duration:.3f}s"
-                    )
-
-                    logger.debug("Génération du rapport PDF")
-                    pdf_start = time.perf_counter()
-                    # Generate PDF report with questions, answers, and results
-                    # Pass client_info to be hashed with reference code as salt
-                    # Pass both markdown and data dict to PDF generator
-                    # Pass pdf_options to control what gets included in the PDF
-                    pdf_path = generate_pdf_report(
-                        survey_name=config["survey_name"],
-                        survey_version=config.get("survey_version", "Unknown"),
-                        questions=questions,
-                        answers=inputs,
-                        markdown_result=markdown_result,
-                        results=result_data,
-                        actual_url=actual_url,
-                        client_info=client_info,
-                        pdf_options=pdf_options,
-                    )
-                    pdf_duration = time.perf_counter() - pdf_start
-                    logger.info(
-                        f"Rapport PDF enregistré dans: {pdf_path} (durée {pdf_duration:.3f}s)"
-                    )
-
-                    # Add result component updates to the dictionary
-                    updates[result_output] = gr.update(
-                        value=markdown_result, visible=True
-                    )
-                    updates[pdf_download] = gr.update(value=pdf_path, visible=True)
+                    if cached_result is not None and os.path.exists(cached_result[1]):
+                        markdown_result, pdf_path = cached_result
+                        logger.info(
+                            "Réponses identiques à une complétion précédente de la session, réutilisation du rapport PDF: {}",
+                            pdf_path,
+                        )
+                        pdf_future = Future()
+                        pdf_future.set_result(pdf_path)
+                    else:
+                        scoring_start = time.perf_counter()
+                        markdown_result, result_data, pdf_options = execute_scoring(
+                            scoring_language, scoring_code, inputs
+                        )
+                        scoring_duration = time.perf_counter() - scoring_start
+                        logger.success(
+                            "Scoring complété avec succès en {:.3f}s", scoring_duration
+                        )
+
+                        logger.debug("Génération du rapport PDF en arrière-plan")
+                        pdf_future = PDF_EXECUTOR.submit(
+                            render_pdf,
+                            inputs,
+                            markdown_result,
+                            result_data,
+                            pdf_options,
+                            client_info,
+                            result_key,
+                        )
+
+                    # The download button is shown by collect_pdf once the file is written
+                    session_key = request.session_hash if request is not None else None
+                    with pending_pdfs_lock:
+                        pending_pdfs[session_key] = pdf_future
+
+                    # Append result component updates (result, PDF, error)
+                    updates.append(gr.update(value=markdown_result, visible=True))
+                    updates.append(gr.update(value=None, visible=False))
                     # Clear any previous warnings on successful completion
-                    updates[error_output] = gr.update(visible=False)
+                    updates.append(gr.update(visible=False))
 
                     return updates
                 except Exception as e:
-                    logger.error(f"Erreur pendant le scoring: {str(e)}", exc_info=True)
-                    # Add error updates to the dictionary
-                    updates[result_output] = gr.update(visible=False)
-                    updates[pdf_download] = gr.update(visible=False)
-                    updates[error_output] = gr.update(value=str(e), visible=True)
+                    logger.error("Erreur pendant le scoring: {}", str(e), exc_info=True)
+                    # Append error updates (result, PDF, error)
+                    updates.append(gr.update(visible=False))
+                    updates.append(gr.update(visible=False))
+                    updates.append(gr.update(value=str(e), visible=True))
                     return updates
             else:
-                # Not at end yet, hide result components
-                updates[result_output] = gr.update(visible=False)
-                updates[pdf_download] = gr.update(visible=False)
-                updates[error_output] = gr.update(visible=False)
+                # Not at end yet, hide result components (result, PDF, error)
+                updates.append(gr.update(visible=False))
+                updates.append(gr.update(visible=False))
+                updates.append(gr.update(visible=False))
                 logger.debug(
-                    f"=== go_next FIN === Retour de {len(updates)} mises à jour de composants (pas encore à la fin)"
+                    "=== go_next FIN === Retour de {} mises à jour de composants (pas encore à la fin)",
+                    len(updates),
                 )
                 return updates
 
-        def go_prev(current_idx, *args):
+        def render_pdf(
+            inputs, markdown_result, result_data, pdf_options, client_info, result_key
+        ):
+            """
+            Génère le rapport PDF d'une complétion (exécuté dans PDF_EXECUTOR).
+
+            Paramètres
+            ----------
+            inputs : Dict[str, Any]
+                Réponses du questionnaire
+            markdown_result : str
+                Résultat du scoring au format markdown
+            result_data : Dict[str, Any]
+                Données du résultat retournées par la fonction de scoring
+            pdf_options : Dict[str, Any]
+                Options contrôlant le contenu du PDF
+            client_info : Dict[str, Any] | None
+                Informations client hachées avec le code de référence
+            result_key : str | None
+                Clé de completed_results sous laquelle mémoriser le rapport, ou None
+
+            Retourne
+            --------
+            str
+                Chemin du rapport PDF généré
+            """
+            pdf_start = time.perf_counter()
+            # Generate PDF report with questions, answers, and results
+            # Pass client_info to be hashed with reference code as salt
+            # Pass both markdown and data dict to PDF generator
+            # Pass pdf_options to control what gets included in the PDF
+            pdf_path = generate_pdf_report(
+                survey_name=config["survey_name"],
+                survey_version=config.get("survey_version", "Unknown"),
+                questions=questions,
+                answers=inputs,
+                markdown_result=markdown_result,
+                results=result_data,
+                actual_url=actual_url,
+                client_info=client_info,
+                pdf_options=pdf_options,
+            )
+            pdf_duration = time.perf_counter() - pdf_start
+            logger.info(
+                "Rapport PDF enregistré dans: {} (durée {:.3f}s)",
+                pdf_path,
+                pdf_duration,
+            )
+
+            if result_key is not None:
+                with completed_results_lock:
+                    if len(completed_results) >= COMPLETED_RESULTS_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        del completed_results[next(iter(completed_results))]
+                    completed_results[result_key] = (markdown_result, pdf_path)
+
+            return pdf_path
+
+        def collect_pdf(request: gr.Request):
+            """
+            Affiche le bouton de téléchargement une fois le rapport PDF généré.
+
+            Chaîné après go_next : si ce clic a terminé le questionnaire, attend la fin de
+            la génération du PDF lancée en arrière-plan, sinon ne modifie rien.
+
+            Paramètres
+            ----------
+            request : gr.Request
+                Requête Gradio, dont le session_hash identifie le PDF en attente
+
+            Retourne
+            --------
+            tuple
+                Mises à jour de (pdf_download, error_output)
+            """
+            session_key = request.session_hash if request is not None else None
+            with pending_pdfs_lock:
+                pdf_future = pending_pdfs.pop(session_key, None)
+            if pdf_future is None:
+                return gr.update(), gr.update()
+
+            try:
+                pdf_path = pdf_future.result()
+            except Exception as e:
+                logger.error(
+                    "Erreur pendant la génération du PDF: {}", str(e), exc_info=True
+                )
+                return gr.update(visible=False), gr.update(value=str(e), visible=True)
+            return gr.update(value=pdf_path, visible=True), gr.update()
+
+        def go_prev(current_idx, previous_states, *args):
             """
             Navigue vers la question précédente, en sautant celles dont les conditions ne sont pas remplies.
 
@@ -595,36 +836,63 @@ def create_survey_interface(
             ----------
             current_idx : int
                 Index de la question actuelle
+            previous_states : list[tuple[bool, bool]] | None
+                Paires (visible, interactive) du dernier affichage (voir update_question_display)
             *args : tuple
                 Valeurs des widgets de toutes les questions dans l'ordre
 
             Retourne
             --------
-            Dict[gr.components.Component, gr.update]
-                Dictionnaire de mises à jour des composants Gradio
+            list
+                Mises à jour alignées sur display_outputs (voir update_question_display)
             """
             logger.info(
-                f"Navigation: Bouton Précédent cliqué depuis la question {current_idx}"
+                "Navigation: Bouton Précédent cliqué depuis la question {}", current_idx
             )
-            logger.debug(f"go_prev a reçu {len(args)} arguments")
+            logger.debug("go_prev a reçu {} arguments", len(args))
 
-            # Build context from current values
-            context = {}
-            for i, q in enumerate(questions):
-                context[q["variable"]] = args[i]
-                # Anonymity: Do not log actual answer values, only variable name and type
-                logger.debug(
-                    f"  go_prev arg[{i}] '{q['variable']}' type: {type(args[i]).__name__}"
-                )
+            if has_any_skip_if:
+                # Build context from current values
+                context = dict(zip(variables, args))
 
-            new_idx = find_next_valid_question(
-                current_idx, questions, context, direction=-1
-            )
+                # Previous question that is not skipped, or the first question if none
+                _skipped, _next_valid, prev_valid = get_skip_table(context)
+                new_idx = prev_valid[current_idx - 1] if current_idx > 0 else 0
+            else:
+                context = None
+                new_idx = max(current_idx - 1, 0)
 
-            logger.debug(f"Navigating from index {current_idx} to {new_idx}")
+            logger.debug("Navigating from index {} to {}", current_idx, new_idx)
 
             # Get display updates as dictionary - widgets keep their current values
-            return update_question_display(new_idx, *args)
+            return update_question_display(
+                new_idx, previous_states, *args, context=context
+            )
+
+        def reset_survey():
+            """
+            Réinitialise le questionnaire sans recharger la page.
+
+            Les widgets reprennent leur valeur initiale et l'affichage revient à la première
+            question, en réutilisant les composants existants plutôt qu'en reconstruisant l'interface.
+
+            Retourne
+            --------
+            list
+                Mises à jour alignées sur next_outputs (voir go_next)
+            """
+            logger.info("Réinitialisation du questionnaire demandée")
+            # No previous state: every row is updated
+            updates = update_question_display(0, None, *initial_values)
+            # Display updates only carry the current answer, so restore all initial values
+            n_questions = len(questions)
+            for i, value in enumerate(initial_values):
+                updates[n_questions + i]["value"] = value
+            # Hide the result components (result, PDF, error)
+            updates.append(gr.update(value=None, visible=False))
+            updates.append(gr.update(value=None, visible=False))
+            updates.append(gr.update(value=None, visible=False))
+            return updates
 
         def compute_score(*args):
             """
@@ -647,9 +915,7 @@ def create_survey_interface(
                 current_idx = args[0]
                 values = args[1:]
 
-                inputs = {}
-                for i, q in enumerate(questions):
-                    inputs[q["variable"]] = values[i]
+                inputs = dict(zip(variables, values))
 
                 logger.debug("Exécution de la fonction de scoring")
                 # Execute scoring - returns (markdown_str, data_dict, pdf_options)
@@ -665,7 +931,7 @@ def create_survey_interface(
                 )
             except Exception as e:
                 logger.error(
-                    f"Erreur pendant le scoring manuel: {str(e)}", exc_info=True
+                    "Erreur pendant le scoring manuel: {}", str(e), exc_info=True
                 )
                 return (
                     "",
@@ -677,35 +943,60 @@ def create_survey_interface(
         logger.debug(
             "Connexion des boutons de navigation et des gestionnaires d'événements"
         )
-        all_widget_inputs = [widgets[q["variable"]]["widget"] for q in questions]
-        all_row_outputs = [widgets[q["variable"]]["row"] for q in questions]
-        all_widget_outputs = [widgets[q["variable"]]["widget"] for q in questions]
+        # Values the widgets were created with, restored by the reload button
+        initial_values = [w.value for w in widget_components]
+        # Input and output specs are built once, as tuples so that the same object can
+        # safely be shared by every event listener (Gradio only reads them)
+        # Input order shared by every handler
+        nav_inputs = (current_question_idx, row_states, *widget_components)
+        # Output order of update_question_display, and of go_next which appends the
+        # result components; the handlers return lists aligned on these
+        display_outputs = (
+            *rows,
+            *widget_components,
+            prev_btn,
+            next_btn,
+            current_question_idx,
+            row_states,
+        )
+        next_outputs = (*display_outputs, result_output, pdf_download, error_output)
 
         logger.debug("Attachement du gestionnaire de clic du bouton Suivant")
-        next_btn.click(
+        next_click = next_btn.click(
             fn=go_next,
-            inputs=[current_question_idx] + all_widget_inputs,
-            outputs=all_row_outputs
-            + all_widget_outputs
-            + [prev_btn, next_btn, current_question_idx]
-            + [result_output, pdf_download, error_output],
+            inputs=nav_inputs,
+            outputs=next_outputs,
             show_progress="hidden",
-        ).then(
+        )
+        # Show the PDF download button once the report rendered in the background is ready
+        next_click.then(
+            fn=collect_pdf,
+            outputs=[pdf_download, error_output],
+            show_progress="hidden",
+        )
+        next_click.then(
             fn=None,
             js="""() => {
-                setTimeout(() => {
-                    // Find all question rows within the question container
+                // Wait for the frame in which the updated rows are rendered
+                requestAnimationFrame(() => {
                     const questionContainer = document.querySelector('.question-container');
                     if (!questionContainer) return;
 
-                    const rows = questionContainer.querySelectorAll('.row');
-
-                    // Find the last visible row (the current question after update)
-                    let currentRow = null;
-                    for (let i = rows.length - 1; i >= 0; i--) {
-                        if (rows[i].offsetParent !== null) {  // Check if row is visible
-                            currentRow = rows[i];
-                            break;
+                    // The current question's row is tagged by update_question_display
+                    let currentRow = questionContainer.querySelector('.active-question');
+
+                    if (!currentRow) {
+                        // Survey completed: no current question, use the last visible row
+                        // checkVisibility() avoids the layout that offsetParent can force
+                        const isVisible = el => el.checkVisibility
+                            ? el.checkVisibility({ checkVisibilityCSS: true })
+                            : el.offsetParent !== null;
+                        const rows = questionContainer.querySelectorAll('.row');
+                        for (let i = rows.length - 1; i >= 0; i--) {
+                            if (isVisible(rows[i])) {
+                                currentRow = rows[i];
+                                break;
+                            }
                         }
                     }
 
@@ -713,17 +1004,15 @@ def create_survey_interface(
                     if (currentRow) {
                         currentRow.scrollIntoView({ behavior: 'smooth', block: 'center' });
                     }
-                }, 100);
+                });
             }""",
         )
 
         logger.debug("Attachement du gestionnaire de clic du bouton Précédent")
         prev_btn.click(
             fn=go_prev,
-            inputs=[current_question_idx] + all_widget_inputs,
-            outputs=all_row_outputs
-            + all_widget_outputs
-            + [prev_btn, next_btn, current_question_idx],
+            inputs=nav_inputs,
+            outputs=display_outputs,
             show_progress="hidden",
         )
 
@@ -731,16 +1020,18 @@ def create_survey_interface(
         # Initialize display on load
         demo.load(
             fn=update_question_display,
-            inputs=[current_question_idx] + all_widget_inputs,
-            outputs=all_row_outputs
-            + all_widget_outputs
-            + [prev_btn, next_btn, current_question_idx],
+            inputs=nav_inputs,
+            outputs=display_outputs,
             show_progress="hidden",
         )
 
         logger.debug("Attachement du gestionnaire du bouton de rechargement")
-        # Wire up reload button to refresh the page
-        reload_btn.click(fn=None, js="() => location.reload()")
+        # Wire up reload button to reset the survey in place, then scroll back to the top
+        reload_btn.click(
+            fn=reset_survey,
+            outputs=next_outputs,
+            show_progress="hidden",
+        ).then(fn=None, js="() => window.scrollTo({ top: 0, behavior: 'smooth' })")
 
     logger.success("Interface du questionnaire créée avec succès")
     return demo
@@ -1,3 +1,6 @@
+import copy
+import os
+from collections import OrderedDict
 from pathlib import Path
 import yaml
 from typing import Any, Dict, Literal
@@ -5,13 +8,76 @@ from loguru import logger
 
 from PrevMed.utils.version import __VERSION__
 
+# Use the libyaml C parser when PyYAML was built with it (much faster than the
+# pure-Python SafeLoader), falling back to SafeLoader otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_yaml(filepath: str) -> Dict[str, Any]:
-    """Charge et parse le fichier de configuration YAML."""
+# Parsed configurations keyed by absolute path, stored with the (mtime in ns, size)
+# they were read at, so that an unchanged file is only parsed and validated once per
+# process; least recently used entries are evicted beyond YAML_CACHE_SIZE
+YAML_CACHE_SIZE = 100
+_YAML_CACHE: "OrderedDict[str, tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+# Scoring language of each supported script extension (compared in lowercase)
+_SCORING_EXTENSIONS: Dict[str, Literal["r", "python"]] = {
+    ".r": "r",
+    ".py": "python",
+    ".python": "python",
+}
+
+
+def load_yaml(filepath: str, deep_copy: bool = True) -> Dict[str, Any]:
+    """
+    Charge et parse le fichier de configuration YAML.
+
+    Le résultat est mémorisé tant que le fichier n'est pas modifié (même chemin,
+    date de modification et taille).
+
+    Paramètres
+    ----------
+    filepath : str
+        Chemin vers le fichier YAML
+    deep_copy : bool, optionnel
+        Si True (par défaut), renvoie une copie profonde que l'appelant peut modifier
+        sans altérer le cache. Si False, renvoie l'objet mis en cache, à ne pas modifier.
+
+    Retourne
+    --------
+    Dict[str, Any]
+        Configuration du questionnaire
+    """
+    st = os.stat(filepath)
+    path = os.path.abspath(filepath)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _YAML_CACHE.move_to_end(path)
+        config = cached[2]
+        logger.debug(f"Configuration YAML déjà chargée, réutilisation: {filepath}")
+    else:
+        config = _parse_yaml(filepath)
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(config) if deep_copy else config
+
+
+def _parse_yaml(filepath: str) -> Dict[str, Any]:
+    """Lit, parse et valide le fichier de configuration YAML (sans cache)."""
     logger.info(f"Chargement de la configuration YAML depuis: {filepath}")
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        logger.debug(f"Chargeur YAML utilisé: {YAML_LOADER.__name__}")
+        # Hand the raw bytes of the whole document to the parser, which detects and
+        # decodes UTF-8 itself, rather than a text file object it reads in chunks.
+        # read() goes until EOF, so pipes and process substitutions (whose size is
+        # reported as 0) are read in full too
+        with open(filepath, "rb") as f:
+            data = f.read()
+        config = yaml.load(data, Loader=YAML_LOADER)
+        if not isinstance(config, dict):
+            raise ValueError(
+                f"Le fichier YAML ne contient pas de configuration (document vide ou qui n'est pas un dictionnaire): {filepath}"
+            )
 
         # Check PrevMed version compatibility
         yaml_version = config.get("PrevMed_version")
@@ -30,23 +96,28 @@ def load_yaml(filepath: str) -> Dict[str, Any]:
             if None in orders:
                 raise ValueError("Certaines questions n'ont pas de champ 'order'")
 
-            # Check for duplicates
-            if len(orders) != len(set(orders)):
-                duplicates = [x for x in orders if orders.count(x) > 1]
-                raise ValueError(
-                    f"Valeurs d'ordre dupliquées trouvées: {set(duplicates)}"
-                )
-
-            # Check that orders start at 1
-            if min(orders) != 1:
-                raise ValueError(
-                    f"L'ordre des questions doit commencer à 1, mais l'ordre minimum trouvé est: {min(orders)}"
-                )
-
-            # Check that orders end at length
-            if max(orders) != len(questions):
+            # Valid orders are exactly a permutation of 1..N: a single sort and compare
+            # checks everything, the details are only worked out to report an error
+            sorted_orders = sorted(orders)
+            if sorted_orders != list(range(1, len(questions) + 1)):
+                # Check for duplicates (equal values are adjacent once sorted)
+                duplicates = {
+                    a for a, b in zip(sorted_orders, sorted_orders[1:]) if a == b
+                }
+                if duplicates:
+                    raise ValueError(
+                        f"Valeurs d'ordre dupliquées trouvées: {duplicates}"
+                    )
+
+                # Check that orders start at 1
+                if sorted_orders[0] != 1:
+                    raise ValueError(
+                        f"L'ordre des questions doit commencer à 1, mais l'ordre minimum trouvé est: {sorted_orders[0]}"
+                    )
+
+                # Otherwise orders don't end at length
                 raise ValueError(
-                    f"L'ordre des questions doit se terminer à {len(questions)}, mais l'ordre maximum trouvé est: {max(orders)}"
+                    f"L'ordre des questions doit se terminer à {len(questions)}, mais l'ordre maximum trouvé est: {sorted_orders[-1]}"
                 )
 
         logger.success(
@@ -79,15 +150,11 @@ def load_scoring_script(filepath: str) -> tuple[Literal["r", "python"], str]:
     """
     logger.info(f"Chargement du script de scoring depuis: {filepath}")
 
-    path = Path(filepath)
-    extension = path.suffix.lower()
+    extension = Path(filepath).suffix.lower()
 
     # Detect language from extension
-    if extension in [".r", ".R"]:
-        language = "r"
-    elif extension in [".py", ".python"]:
-        language = "python"
-    else:
+    language = _SCORING_EXTENSIONS.get(extension)
+    if language is None:
         error_msg = f"Extension de fichier non reconnue: '{extension}'. Utilisez .R/.r pour R ou .py/.python pour Python"
         logger.error(error_msg)
         raise ValueError(error_msg)
@@ -1,35 +1,46 @@
 JS_HEAD = """
 <script>
 // Add Enter key shortcut to click the "Suivant" button or PDF download button
-document.addEventListener('DOMContentLoaded', function() {
-    document.addEventListener('keydown', function(e) {
-        // Check if Enter key was pressed (without Shift)
-        if (e.key === 'Enter' && !e.shiftKey) {
-            // Find the "Suivant →" button and click it if visible
-            const buttons = Array.from(document.querySelectorAll('button'));
-            const nextButton = buttons.find(btn => btn.textContent.includes('Suivant'));
+// The buttons are found by the elem_id set on them in gui.py
+(function() {
+    // checkVisibility() reads the computed style instead of forcing a layout like
+    // offsetParent; the latter is kept for browsers without it
+    const isVisible = el => el.checkVisibility
+        ? el.checkVisibility({ checkVisibilityCSS: true })
+        : el.offsetParent !== null;
 
-            if (nextButton && nextButton.offsetParent !== null) {
-                e.preventDefault();
-                nextButton.click();
-            } else {
-                // If "Suivant" button is not visible, look for PDF download button
-                const pdfButton = buttons.find(btn => btn.textContent.includes('Télécharger le rapport PDF'));
+    // Registered once on window, which exists before the DOM is loaded
+    window.addEventListener('keydown', function(e) {
+        // Only Enter (without Shift) is handled, every other key returns immediately
+        if (e.key !== 'Enter' || e.shiftKey) return;
+
+        // Enter inserts a newline in multi-line text fields and editable content
+        const target = e.target;
+        if (target && (target.isContentEditable ||
+            (target.tagName === 'TEXTAREA' && target.rows > 1))) return;
+
+        // Click the "Suivant →" button if visible
+        const nextButton = document.getElementById('prevmed-next-btn');
 
-                if (pdfButton && pdfButton.offsetParent !== null) {
-                    e.preventDefault();
-                    pdfButton.click();
-                }
+        if (nextButton && isVisible(nextButton)) {
+            e.preventDefault();
+            nextButton.click();
+        } else {
+            // If "Suivant" button is not visible, look for PDF download button
+            const pdfButton = document.getElementById('prevmed-pdf-btn');
+
+            if (pdfButton && isVisible(pdfButton)) {
+                e.preventDefault();
+                pdfButton.click();
             }
         }
-    });
-});
+    }, { passive: false });
+})();
 
 // Track PDF download clicks with Umami
 document.addEventListener('click', function(e) {
-    // Check if clicked element is a button containing the PDF download text
-    if (e.target.tagName === 'BUTTON' &&
-        e.target.textContent.includes('Télécharger le rapport PDF')) {
+    // Check if clicked element is the PDF download button (or inside it)
+    if (e.target.closest && e.target.closest('#prevmed-pdf-btn')) {
 
         // Only track if umami is available
         if (typeof umami !== 'undefined') {
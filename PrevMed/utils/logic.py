@@ -1,6 +1,254 @@
+import ast
+import functools
 import gradio as gr
 from loguru import logger
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
+
+# Globals of every condition evaluation: no builtins, only the context variables
+# are reachable. Shared so that evaluations don't allocate a new dict each time
+_SAFE_GLOBALS = {"__builtins__": {}}
+
+# Syntax allowed in skip_if/valid_if conditions: variables, constants, comparisons,
+# boolean logic, arithmetic, conditional expressions and literal collections (e.g. for
+# `sex in ('M', 'F')`). Anything else, notably attribute access, subscripts, calls,
+# assignment expressions and **, is rejected when the survey is loaded, so that a
+# condition cannot reach objects beyond the answers it is evaluated with
+_ALLOWED_CONDITION_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Is,
+    ast.IsNot,
+    ast.In,
+    ast.NotIn,
+    ast.IfExp,
+    ast.Tuple,
+    ast.List,
+    ast.Set,
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_condition(condition: str, kind: str):
+    """Vérifie et compile une expression de condition en objet code (mémorisé), ou lève RuntimeError."""
+    try:
+        tree = ast.parse(condition, filename=f"<{kind}>", mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_CONDITION_NODES):
+                raise ValueError(f"construction non supportée: {type(node).__name__}")
+        # The validated tree is compiled as is, without parsing the source again
+        return compile(tree, f"<{kind}>", "eval")
+    except (SyntaxError, ValueError) as e:
+        logger.error(f"Condition {kind} invalide '{condition}': {e}")
+        raise RuntimeError(f"Condition {kind} invalide '{condition}': {e}") from e
+
+
+def compile_skip_if(condition: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile une condition skip_if une seule fois et retourne une fonction d'évaluation.
+
+    L'expression est analysée, vérifiée (seules les variables, constantes, comparaisons,
+    opérations booléennes et arithmétiques sont acceptées) et compilée en bytecode à la
+    construction de l'interface, de sorte que chaque clic de navigation n'exécute plus
+    que le bytecode.
+
+    Paramètres
+    ----------
+    condition : str
+        Expression Python à évaluer pour déterminer si la question doit être sautée
+
+    Retourne
+    --------
+    Callable[[Dict[str, Any]], bool]
+        Fonction prenant le contexte et retournant True si la question doit être sautée
+
+    Lève
+    ----
+    RuntimeError
+        Si la condition est invalide ou utilise une construction non supportée
+        (l'évaluation lève aussi RuntimeError)
+    """
+    code = _compile_condition(condition, "skip_if")
+
+    def skip_fn(context: Dict[str, Any]) -> bool:
+        try:
+            # Use restricted eval with only the context variables available
+            return bool(eval(code, _SAFE_GLOBALS, context))
+        except Exception as e:
+            logger.warning(f"Échec de l'évaluation de la condition '{condition}': {e}")
+            raise RuntimeError(
+                f"Échec de l'évaluation de la condition '{condition}': {e}"
+            ) from e
+
+    return skip_fn
+
+
+def compile_valid_if(condition: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile une condition valid_if une seule fois et retourne une fonction d'évaluation.
+
+    Paramètres
+    ----------
+    condition : str
+        Expression Python à évaluer pour la validation
+
+    Retourne
+    --------
+    Callable[[Dict[str, Any]], bool]
+        Fonction prenant le contexte et retournant True si la réponse est valide
+
+    Lève
+    ----
+    RuntimeError
+        Si la condition est invalide ou utilise une construction non supportée
+        (l'évaluation lève aussi RuntimeError)
+    """
+    code = _compile_condition(condition, "valid_if")
+
+    def valid_fn(context: Dict[str, Any]) -> bool:
+        try:
+            # Use restricted eval with only the context variables available
+            return bool(eval(code, _SAFE_GLOBALS, context))
+        except Exception as e:
+            logger.warning(
+                f"Échec de l'évaluation de la condition valid_if '{condition}': {e}"
+            )
+            raise RuntimeError(
+                f"Échec de l'évaluation de la condition valid_if '{condition}': {e}"
+            ) from e
+
+    return valid_fn
+
+
+def compile_skip_all(
+    conditions: List[Optional[str]],
+) -> Callable[[Dict[str, Any]], tuple[bool, ...]]:
+    """
+    Compile toutes les conditions skip_if d'un questionnaire en une seule expression.
+
+    Les conditions sont regroupées dans un unique tuple compilé une seule fois, de sorte
+    qu'un seul eval() évalue toutes les questions au lieu d'un appel par question.
+
+    Paramètres
+    ----------
+    conditions : List[Optional[str]]
+        Condition skip_if de chaque question, ou None si la question n'en a pas
+
+    Retourne
+    --------
+    Callable[[Dict[str, Any]], tuple[bool, ...]]
+        Fonction prenant le contexte et retournant, pour chaque question, True si elle doit être sautée
+
+    Lève
+    ----
+    RuntimeError
+        Si une condition ne peut pas être compilée (l'évaluation lève aussi RuntimeError)
+    """
+    skip_fns = [compile_skip_if(c) if c is not None else None for c in conditions]
+    # One condition per line, so that a trailing comment cannot swallow the next one
+    source = "(\n" + "".join(f"({c}\n),\n" for c in conditions if c is not None) + ")"
+    code = _compile_condition(source, "skip_if")
+    positions = [i for i, c in enumerate(conditions) if c is not None]
+    n = len(conditions)
+
+    def skip_all(context: Dict[str, Any]) -> tuple[bool, ...]:
+        try:
+            # Use restricted eval with only the context variables available
+            values = eval(code, _SAFE_GLOBALS, context)
+        except Exception:
+            # Evaluate the conditions one by one to report the one that failed
+            for fn in skip_fns:
+                if fn is not None:
+                    fn(context)
+            raise
+        skipped = [False] * n
+        for i, value in zip(positions, values):
+            skipped[i] = bool(value)
+        return tuple(skipped)
+
+    return skip_all
+
+
+def condition_variables(condition: str) -> set[str]:
+    """
+    Retourne les noms de variables référencés par une expression de condition.
+
+    Paramètres
+    ----------
+    condition : str
+        Expression Python d'une condition skip_if ou valid_if
+
+    Retourne
+    --------
+    set[str]
+        Ensemble des noms utilisés dans l'expression
+    """
+    tree = ast.parse(condition, mode="eval")
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+
+def build_skip_table(
+    skip_all: Callable[[Dict[str, Any]], tuple[bool, ...]], context: Dict[str, Any]
+) -> tuple[tuple[bool, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Évalue toutes les conditions skip_if pour un contexte et précalcule les sauts de navigation.
+
+    Paramètres
+    ----------
+    skip_all : Callable[[Dict[str, Any]], tuple[bool, ...]]
+        Conditions skip_if de toutes les questions, compilées avec compile_skip_all()
+    context : Dict[str, Any]
+        Valeurs des variables utilisées par les conditions
+
+    Retourne
+    --------
+    tuple[tuple[bool, ...], tuple[int, ...], tuple[int, ...]]
+        (skipped, next_valid, prev_valid) où skipped[i] indique si la question i est sautée,
+        next_valid[i] est l'index de la première question posée à partir de i (nombre de
+        questions si aucune) et prev_valid[i] celui de la dernière question posée jusqu'à i (0 si aucune)
+
+    Lève
+    ----
+    RuntimeError
+        Si une condition ne peut pas être évaluée
+    """
+    skipped = skip_all(context)
+    n = len(skipped)
+
+    next_valid = [n] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        next_valid[i] = next_valid[i + 1] if skipped[i] else i
+
+    prev_valid = [0] * n
+    for i in range(n):
+        if not skipped[i]:
+            prev_valid[i] = i
+        elif i > 0:
+            prev_valid[i] = prev_valid[i - 1]
+
+    return skipped, tuple(next_valid), tuple(prev_valid)
 
 
 def evaluate_skip_if(condition: str, context: Dict[str, Any]) -> bool:
@@ -28,15 +276,7 @@ def evaluate_skip_if(condition: str, context: Dict[str, Any]) -> bool:
     RuntimeError
         Si la condition ne peut pas être évaluée
     """
-    try:
-        # Use restricted eval with only the context variables available
-        result = bool(eval(condition, {"__builtins__": {}}, context))
-        return result
-    except Exception as e:
-        logger.warning(f"Échec de l'évaluation de la condition '{condition}': {e}")
-        raise RuntimeError(
-            f"Échec de l'évaluation de la condition '{condition}': {e}"
-        ) from e
+    return compile_skip_if(condition)(context)
 
 
 def evaluate_valid_if(condition: str, context: Dict[str, Any]) -> bool:
@@ -63,21 +303,15 @@ def evaluate_valid_if(condition: str, context: Dict[str, Any]) -> bool:
     RuntimeError
         Si la condition ne peut pas être évaluée
     """
-    try:
-        # Use restricted eval with only the context variables available
-        result = bool(eval(condition, {"__builtins__": {}}, context))
-        return result
-    except Exception as e:
-        logger.warning(
-            f"Échec de l'évaluation de la condition valid_if '{condition}': {e}"
-        )
-        raise RuntimeError(
-            f"Échec de l'évaluation de la condition valid_if '{condition}': {e}"
-        ) from e
+    return compile_valid_if(condition)(context)
 
 
 def find_next_valid_question(
-    current_idx: int, questions: List[Dict], context: Dict[str, Any], direction: int = 1
+    current_idx: int,
+    questions: List[Dict],
+    context: Dict[str, Any],
+    direction: int = 1,
+    skip_fns: Optional[tuple[Optional[Callable[[Dict[str, Any]], bool]], ...]] = None,
 ) -> int:
     """
     Trouve l'index de la prochaine question valide en fonction des conditions de saut.
@@ -92,6 +326,10 @@ def find_next_valid_question(
         Valeurs actuelles de toutes les variables
     direction : int
         1 pour suivant, -1 pour précédent
+    skip_fns : tuple, optionnel
+        Fonction skip_if compilée de chaque question (None si la question n'en a pas),
+        parallèle à `questions`. Si fourni, le parcours n'examine plus les dictionnaires
+        des questions : les questions sans skip_if se réduisent à un incrément d'index.
 
     Retourne
     --------
@@ -100,22 +338,49 @@ def find_next_valid_question(
     """
     direction_str = "suivante" if direction == 1 else "précédente"
     logger.debug(
-        f"Recherche de la {direction_str} question valide depuis l'index {current_idx}"
+        "Recherche de la {} question valide depuis l'index {}",
+        direction_str,
+        current_idx,
     )
 
     idx = current_idx + direction
+    n = len(questions)
+
+    if skip_fns is not None:
+        while 0 <= idx < n:
+            skip_fn = skip_fns[idx]
+            if skip_fn is None or not skip_fn(context):
+                logger.debug(
+                    "Question valide {} trouvée à l'index {}", direction_str, idx
+                )
+                return idx
+            idx += direction
+        final_idx = idx if idx >= n else 0
+        logger.debug(
+            "Aucune question valide {} trouvée, retour de l'index {}",
+            direction_str,
+            final_idx,
+        )
+        return final_idx
 
-    while 0 <= idx < len(questions):
+    while 0 <= idx < n:
         if "skip_if" not in questions[idx]:
             logger.debug(
-                f"Question valide {direction_str} trouvée à l'index {idx} car clé 'skip_if' absente."
+                "Question valide {} trouvée à l'index {} car clé 'skip_if' absente.",
+                direction_str,
+                idx,
             )
             return idx
 
-        condition = questions[idx]["skip_if"]
-        if not evaluate_skip_if(condition, context):
+        # Use the condition precompiled at interface build time when available
+        skip_fn = questions[idx].get("_skip_fn")
+        if skip_fn is None:
+            skip_fn = compile_skip_if(questions[idx]["skip_if"])
+        if not skip_fn(context):
             logger.debug(
-                f"Question valide {direction_str} trouvée à l'index {idx}. 'skip_if' a retourné False."
+                "Question valide {} trouvée à l'index {}. 'skip_if' a retourné False.",
+                direction_str,
+                idx,
             )
             return idx
         idx += direction
@@ -125,6 +390,8 @@ def find_next_valid_question(
     # For backward: return 0 to go to first question
     final_idx = idx if idx >= len(questions) else 0
     logger.debug(
-        f"Aucune question valide {direction_str} trouvée, retour de l'index {final_idx}"
+        "Aucune question valide {} trouvée, retour de l'index {}",
+        direction_str,
+        final_idx,
     )
     return final_idx
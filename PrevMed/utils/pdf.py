@@ -5,6 +5,8 @@ Gère la création de rapports PDF formatés contenant les réponses au question
 Utilise la bibliothèque ReportLab qui fournit un support Unicode natif et des capacités de formatage avancées.
 """
 
+import os
+import stat
 import time
 import random
 import string
@@ -12,6 +14,11 @@ import json
 import gzip
 import csv
 import hashlib
+import html
+import itertools
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List
 from filelock import FileLock, Timeout
@@ -28,22 +35,205 @@ from reportlab.platypus import (
 )
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from loguru import logger
 
 from PrevMed.utils.settings import settings
 from PrevMed.utils.version import __VERSION__
 
+try:
+    # Optional: faster serialization of the survey JSON archives
+    import orjson
+except ImportError:
+    orjson = None
+
 # Character sets for generating human-readable reference codes
 # Exclude ambiguous characters: no 0/O, no 1/I/l for easier human reading
 UNAMBIGUOUS_LETTERS = "ABCDFGHJKLMNPQRSTUVWXY"  # 22 letters (no I, O, E, Z)
 UNAMBIGUOUS_DIGITS = "23456789"  # 8 digits (no 0, 1)
-UNAMBIGUOUS_CHARS = UNAMBIGUOUS_LETTERS + UNAMBIGUOUS_DIGITS  # 32 total chars
+UNAMBIGUOUS_CHARS = UNAMBIGUOUS_LETTERS + UNAMBIGUOUS_DIGITS  # 30 total chars
+
+# Letter/digit layouts of a valid 3-character code part (at least one letter and one
+# digit), weighted by the number of parts sharing each layout so that every valid
+# part is equally likely when a layout is drawn and then filled
+CODE_PART_LAYOUTS = [
+    layout
+    for layout in itertools.product((UNAMBIGUOUS_LETTERS, UNAMBIGUOUS_DIGITS), repeat=3)
+    if UNAMBIGUOUS_LETTERS in layout and UNAMBIGUOUS_DIGITS in layout
+]
+CODE_PART_CUM_WEIGHTS = list(
+    itertools.accumulate(
+        math.prod(len(chars) for chars in layout) for layout in CODE_PART_LAYOUTS
+    )
+)
+
+# Characters replaced in result row labels and column headers to build CSV column
+# names (separators and the accented letters used in results tables)
+CSV_KEY_TRANSLATION = str.maketrans(
+    {"/": "_", " ": "_", "é": "e", "è": "e", "à": "a", "ô": "o"}
+)
+
+# Number of data rows after which the CSV log is archived and a new one is started
+CSV_ROTATION_ROWS = 1000
 
 # Base directory to store compressed JSON data files (PDFs are temporary)
+# Temporary PDFs go to settings.temp_pdf_dir (cleaned up automatically)
 DATA_OUTPUT_DIR = "survey_data"
 
-# Directory for temporary PDF files (cleaned up automatically)
-TEMP_PDF_DIR = "temp_pdfs"
+# Submissions are archived (compressed JSON and CSV log) by a single background
+# thread: the report doesn't wait for the disk, and CSV appends from this process
+# never contend for the file lock. Pending writes are completed at interpreter exit
+ARCHIVE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="prevmed-archive"
+)
+
+# Submissions waiting to be archived: (json path, json data, csv path, csv row)
+# Each archiving task writes all of them, with one CSV lock acquisition per file
+_pending_archives: List[tuple] = []
+_pending_archives_lock = threading.Lock()
+
+# One FileLock per CSV lock file, reused by every submission instead of rebuilt per call
+_csv_locks: Dict[str, FileLock] = {}
+_csv_locks_lock = threading.Lock()
+
+# Paragraph styles of the PDF report, built once: platypus only reads them while
+# rendering, so they are shared by every report
+_SAMPLE_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_SAMPLE_STYLES["Heading1"],
+    fontSize=16,
+    textColor=colors.HexColor("#000000"),
+    spaceAfter=12,
+    alignment=TA_CENTER,
+)
+_REFERENCE_STYLE = ParagraphStyle(
+    "ReferenceCode",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=14,
+    fontName="Helvetica-Bold",
+    textColor=colors.HexColor("#006400"),  # Dark green for emphasis
+    spaceAfter=10,
+    alignment=TA_CENTER,
+)
+_SUBTITLE_STYLE = ParagraphStyle(
+    "CustomSubtitle",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=10,
+    textColor=colors.HexColor("#666666"),
+    spaceAfter=6,
+    fontName="Helvetica-Oblique",
+)
+_HEADING_STYLE = ParagraphStyle(
+    "CustomHeading",
+    parent=_SAMPLE_STYLES["Heading2"],
+    fontSize=14,
+    spaceAfter=10,
+)
+_QUESTION_STYLE = ParagraphStyle(
+    "Question",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=11,
+    fontName="Helvetica-Bold",
+    spaceAfter=4,
+)
+_ANSWER_STYLE = ParagraphStyle(
+    "Answer",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=11,
+    # Includes the gap before the next question, rather than a separate Spacer
+    spaceAfter=8 + 3 * mm,
+)
+
+# Style of the markdown results text
+# Using Paragraph instead of Preformatted for better cross-viewer compatibility
+_MARKDOWN_STYLE = ParagraphStyle(
+    "MarkdownResults",
+    parent=_SAMPLE_STYLES["Normal"],
+    fontSize=10,
+    fontName="Courier",
+    textColor=colors.black,
+    backColor=None,  # Explicitly no background
+    leftIndent=10 * mm,
+    # Each line takes 12pt + 2 mm, the gap after a block being part of its last line
+    leading=12 + 2 * mm,
+)
+
+# Style of a markdown line too long to fit on one row: its wrapped rows keep the
+# normal 12pt leading and the 2 mm gap only follows the whole line
+_MARKDOWN_WRAPPED_STYLE = ParagraphStyle(
+    "MarkdownResultsWrapped",
+    parent=_MARKDOWN_STYLE,
+    leading=12,
+    spaceAfter=2 * mm,
+)
+
+# PrevMed version line of the report header (the same for every report)
+_PREVMED_VERSION_LINE = f"Version PrevMed : {__VERSION__}"
+
+# Style of the scoring results table (header row, then data rows)
+_RESULTS_TABLE_STYLE = TableStyle(
+    [
+        # Cells are left-aligned in Helvetica by default: only the size is set for all
+        ("FONTSIZE", (0, 0), (-1, -1), 11),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ]
+)
+
+# Minimum number of seconds between two scans of the temporary PDF directory, and
+# the time of the last scan (0 until the first one)
+CLEANUP_INTERVAL_SECONDS = 300
+_last_cleanup_time = 0.0
+
+
+def _escape_markup(text: str) -> str:
+    """Échappe &, < et > pour un Paragraph ReportLab (texte renvoyé tel quel s'il n'en contient pas)."""
+    # Most texts contain none of them: three substring checks are much cheaper than
+    # html.escape's replace passes over the whole string
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return html.escape(text, quote=False)
+
+
+def ensure_private_dir(path: Path) -> None:
+    """
+    Crée un répertoire accessible au seul utilisateur courant (mode 0700).
+
+    Les PDF temporaires contiennent les réponses des patients : sur une machine
+    partagée, leur répertoire ne doit être ni lisible par les autres utilisateurs, ni
+    un répertoire créé à l'avance par l'un d'eux (par exemple dans /tmp).
+
+    Paramètres
+    ----------
+    path : Path
+        Répertoire à créer, ou à vérifier s'il existe déjà
+
+    Lève
+    ----
+    PermissionError
+        Si le chemin est un lien symbolique, n'est pas un répertoire ou appartient à
+        un autre utilisateur
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(
+            f"Le répertoire des PDF temporaires n'est pas un répertoire: {path}"
+        )
+    # Ownership and permission bits are only meaningful on POSIX systems
+    if hasattr(os, "getuid"):
+        if st.st_uid != os.getuid():
+            raise PermissionError(
+                f"Le répertoire des PDF temporaires appartient à un autre utilisateur: {path}"
+            )
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)
 
 
 def cleanup_old_pdfs(temp_dir: str, max_age_seconds: int = 3600) -> None:
@@ -52,6 +242,7 @@ def cleanup_old_pdfs(temp_dir: str, max_age_seconds: int = 3600) -> None:
 
     Cette fonction est appelée avant chaque génération de PDF pour s'assurer que les fichiers temporaires
     ne s'accumulent pas indéfiniment. L'âge par défaut est de 1 heure (3600 secondes).
+    Le répertoire n'est réellement parcouru qu'une fois par CLEANUP_INTERVAL_SECONDS au plus.
 
     Paramètres
     ----------
@@ -60,35 +251,46 @@ def cleanup_old_pdfs(temp_dir: str, max_age_seconds: int = 3600) -> None:
     max_age_seconds : int, optionnel
         Âge maximum en secondes avant qu'un fichier ne soit supprimé (par défaut : 3600 = 1 heure)
     """
-    temp_path = Path(temp_dir)
+    global _last_cleanup_time
+
+    current_time = time.time()
+
+    # Files only become stale after max_age_seconds, scanning on every request is wasteful
+    if current_time - _last_cleanup_time < CLEANUP_INTERVAL_SECONDS:
+        return
+    _last_cleanup_time = current_time
 
     # Skip if directory doesn't exist yet
-    if not temp_path.exists():
+    if not os.path.isdir(temp_dir):
         logger.debug(f"Le répertoire PDF temporaire n'existe pas encore: {temp_dir}")
         return
 
-    current_time = time.time()
     deleted_count = 0
     error_count = 0
 
     # Iterate over all PDF files in the directory
-    for pdf_file in temp_path.glob("*.pdf"):
-        try:
-            # Get file modification time
-            file_age = current_time - pdf_file.stat().st_mtime
-
-            # Delete if older than max_age_seconds
-            if file_age > max_age_seconds:
-                pdf_file.unlink()
-                deleted_count += 1
-                logger.debug(
-                    f"PDF temporaire ancien supprimé: {pdf_file.name} (âge: {file_age / 60:.1f} minutes)"
+    # scandir entries carry their name and cache their stat result, avoiding a Path
+    # object and repeated stat() calls per file
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pdf"):
+                continue
+            try:
+                # Get file modification time
+                file_age = current_time - entry.stat().st_mtime
+
+                # Delete if older than max_age_seconds
+                if file_age > max_age_seconds:
+                    os.unlink(entry.path)
+                    deleted_count += 1
+                    logger.debug(
+                        f"PDF temporaire ancien supprimé: {entry.name} (âge: {file_age / 60:.1f} minutes)"
+                    )
+            except Exception as e:
+                error_count += 1
+                logger.warning(
+                    f"Échec de la suppression du PDF temporaire {entry.name}: {e}"
                 )
-        except Exception as e:
-            error_count += 1
-            logger.warning(
-                f"Échec de la suppression du PDF temporaire {pdf_file.name}: {e}"
-            )
 
     if deleted_count > 0:
         logger.info(
@@ -98,6 +300,141 @@ def cleanup_old_pdfs(temp_dir: str, max_age_seconds: int = 3600) -> None:
         logger.warning(f"Échec de la suppression de {error_count} PDF temporaire(s)")
 
 
+def _read_csv_row_count(csv_file_path: str) -> int:
+    """
+    Retourne le nombre de lignes de données (hors en-tête) du journal CSV.
+
+    Le nombre est lu dans le fichier compteur `<csv>.count`, qui mémorise aussi la taille
+    du CSV au moment de son écriture. S'il est absent ou ne correspond plus au CSV (fichier
+    modifié hors de PrevMed, interruption entre deux écritures), les lignes sont recomptées.
+    """
+    size = os.path.getsize(csv_file_path)
+    try:
+        with open(csv_file_path + ".count", "r", encoding="utf-8") as f:
+            count_str, size_str = f.read().split()
+        if int(size_str) == size:
+            return int(count_str)
+    except (OSError, ValueError):
+        pass
+
+    # Quoted fields may span several lines, so rows are counted with the CSV reader
+    with open(csv_file_path, "r", encoding="utf-8", newline="") as f:
+        return max(sum(1 for row in csv.reader(f) if row) - 1, 0)
+
+
+def _write_csv_row_count(csv_file_path: str, row_count: int) -> None:
+    """Enregistre le nombre de lignes de données et la taille actuelle du journal CSV."""
+    with open(csv_file_path + ".count", "w", encoding="utf-8") as f:
+        f.write(f"{row_count} {os.path.getsize(csv_file_path)}")
+
+
+def _hash_answers(answers: Dict[str, Any]) -> str:
+    """
+    Retourne le hash tronqué (12 caractères hexadécimaux de SHA-256) des réponses,
+    utilisé pour détecter les soumissions identiques indépendamment des métadonnées.
+    """
+    answers_str = json.dumps(answers, sort_keys=True)
+    return hashlib.sha256(answers_str.encode("utf-8")).hexdigest()[:12]
+
+
+def _hash_client_info(
+    reference_code: str, client_info: Dict[str, Any] = None
+) -> Dict[str, str]:
+    """
+    Hache individuellement chaque clé de client_info, salée avec le code de référence.
+
+    Retourne
+    --------
+    Dict[str, str]
+        Dictionnaire {"<clé>_hash": hash tronqué à 12 caractères, ou "NA" en cas d'échec}
+    """
+    client_hashes = {}
+    if not client_info:
+        return client_hashes
+
+    # The salt prefix is hashed once; each key continues from a copy of that state,
+    # which gives the same digest as hashing "reference_code:value" from scratch
+    salted_base = hashlib.sha256(f"{reference_code}:".encode("utf-8"))
+    for key, value in client_info.items():
+        try:
+            # Create deterministic string and hash with reference code as salt
+            value_str = (
+                json.dumps(value, sort_keys=True)
+                if not isinstance(value, str)
+                else value
+            )
+            h = salted_base.copy()
+            h.update(value_str.encode("utf-8"))
+            client_hashes[f"{key}_hash"] = h.hexdigest()[:12]
+        except Exception as e:
+            logger.warning(f"Échec du hachage de la clé client_info '{key}': {e}")
+            client_hashes[f"{key}_hash"] = "NA"
+    return client_hashes
+
+
+def _build_row_data(
+    reference_code: str,
+    row_number: int,
+    timestamp: int,
+    results: Dict[str, str],
+    answers_hash: str,
+    client_hashes: Dict[str, str],
+) -> Dict[str, Any]:
+    """Assemble la ligne du journal CSV : colonnes fixes, résultats de scoring, puis hashs."""
+    row_data = {
+        "reference_code": reference_code,
+        "row_number": row_number,
+        "timestamp_unix": timestamp,
+        # Human-readable datetime
+        "datetime": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)),
+    }
+
+    # Add scoring results (dynamic columns based on results dict)
+    # Results dict is created from table data by combining row labels with column headers
+    for key, value in results.items():
+        # Values are already strings from table data, store as-is
+        row_data[key] = str(value)
+
+    row_data["answers_hash"] = answers_hash
+    row_data.update(client_hashes)
+    return row_data
+
+
+def _default_csv_fieldnames(row_data: Dict[str, Any]) -> List[str]:
+    """Ordre des colonnes d'un nouveau CSV : colonnes fixes, résultats, puis hashs."""
+    fixed_cols = [
+        "reference_code",
+        "row_number",
+        "timestamp_unix",
+        "datetime",
+    ]
+    scoring_cols = [
+        k for k in row_data.keys() if k not in fixed_cols and not k.endswith("_hash")
+    ]
+    hash_cols = ["answers_hash"] + [
+        k for k in row_data.keys() if k.endswith("_hash") and k != "answers_hash"
+    ]
+    return fixed_cols + scoring_cols + hash_cols
+
+
+def _merge_csv_fieldnames(fieldnames: List[str], row_data: Dict[str, Any]) -> None:
+    """Ajoute à fieldnames (modifié en place) les colonnes de row_data qui y manquent."""
+    for key in row_data.keys():
+        if key not in fieldnames:
+            # Hash keys (answers_hash and client_*_hash) should go at the end
+            # Scoring result keys should go before answers_hash
+            if key == "answers_hash" or key.endswith("_hash"):
+                # Hash keys go at the end
+                fieldnames.append(key)
+            elif "answers_hash" in fieldnames:
+                # Scoring result keys go before answers_hash
+                hash_idx = fieldnames.index("answers_hash")
+                fieldnames.insert(hash_idx, key)
+            else:
+                # No answers_hash yet, append at end
+                fieldnames.append(key)
+
+
 def append_to_csv_log(
     csv_file_path: str,
     reference_code: str,
@@ -105,12 +442,17 @@ def append_to_csv_log(
     results: Dict[str, str],
     json_data: Dict[str, Any],
     client_info: Dict[str, Any] = None,
+    answers_hash: str = None,
+    client_hashes: Dict[str, str] = None,
 ) -> None:
     """
     Ajoute de manière atomique les données de soumission du questionnaire au fichier journal CSV.
 
-    Utilise filelock pour le verrouillage de fichiers multiplateforme et les écritures atomiques afin d'éviter
-    la corruption des données en cas d'accès concurrent. Crée le CSV avec les en-têtes s'il n'existe pas.
+    Utilise filelock pour le verrouillage de fichiers multiplateforme afin d'éviter la corruption
+    des données en cas d'accès concurrent. Crée le CSV avec les en-têtes s'il n'existe pas.
+    La nouvelle ligne est simplement ajoutée en fin de fichier ; le CSV n'est jamais réécrit :
+    s'il est plein ou si de nouvelles colonnes apparaissent, il est archivé et un nouveau
+    fichier est créé avec l'en-tête étendu.
 
     Paramètres
     ----------
@@ -126,14 +468,67 @@ def append_to_csv_log(
         Données JSON complètes (doit contenir la clé 'answers' pour le calcul du hash)
     client_info : Dict[str, Any], optionnel
         Dictionnaire d'informations client (chaque clé sera hachée individuellement pour la confidentialité)
+    answers_hash : str, optionnel
+        Hash des réponses déjà calculé par l'appelant ; recalculé depuis json_data si absent
+    client_hashes : Dict[str, str], optionnel
+        Hashs de client_info déjà calculés par l'appelant ; recalculés si absents
     """
     logger.debug(
         f"Ajout de la soumission {reference_code} au journal CSV à {csv_file_path}"
     )
 
+    # Callers that already computed the hashes pass them in to avoid a second pass
+    if answers_hash is None:
+        answers_hash = _hash_answers(json_data["answers"])
+    if client_hashes is None:
+        client_hashes = _hash_client_info(reference_code, client_info)
+    row_data = _build_row_data(
+        reference_code, 1, timestamp, results, answers_hash, client_hashes
+    )
+    _append_rows_to_csv_log(csv_file_path, [row_data])
+
+
+def _archive_csv_log(csv_file_path: str, timestamp: int) -> Path:
+    """
+    Déplace le journal CSV vers `survey_submissions_{timestamp}.csv` dans le même
+    répertoire (suffixé `_2`, `_3`... si ce nom existe déjà) et retourne ce chemin.
+    """
+    csv_dir = Path(csv_file_path).parent
+    archive_path = csv_dir / f"survey_submissions_{timestamp}.csv"
+    suffix = 1
+    # Several rotations can happen within the same second: never overwrite an archive
+    while archive_path.exists():
+        suffix += 1
+        archive_path = csv_dir / f"survey_submissions_{timestamp}_{suffix}.csv"
+    Path(csv_file_path).rename(archive_path)
+    return archive_path
+
+
+def _get_csv_lock(csv_lock_file: str) -> FileLock:
+    """Retourne le verrou (partagé par toutes les soumissions) du fichier de verrou donné."""
+    with _csv_locks_lock:
+        lock = _csv_locks.get(csv_lock_file)
+        if lock is None:
+            lock = _csv_locks[csv_lock_file] = FileLock(csv_lock_file, timeout=10)
+        return lock
+
+
+def _append_rows_to_csv_log(csv_file_path: str, rows: List[Dict[str, Any]]) -> None:
+    """
+    Ajoute une ou plusieurs lignes déjà construites (voir _build_row_data) au journal CSV,
+    sous une seule prise du verrou. Les numéros de ligne sont attribués ici.
+
+    En cas d'expiration du verrou, les lignes sont écrites dans un CSV de secours.
+    """
+    logger.debug(
+        "Lignes CSV à ajouter: {}",
+        [(row["reference_code"], row["answers_hash"]) for row in rows],
+    )
+    timestamp = rows[0]["timestamp_unix"]
+
     # Create lock file for atomic access
     csv_lock_file = csv_file_path + ".lock"
-    lock = FileLock(csv_lock_file, timeout=10)
+    lock = _get_csv_lock(csv_lock_file)
 
     # Define temp file path early so exception handler can always reference it
     temp_csv = csv_file_path + ".tmp"
@@ -144,163 +539,63 @@ def append_to_csv_log(
             file_exists = Path(csv_file_path).exists()
 
             if file_exists:
-                # Read existing CSV to get row count and verify headers
-                with open(csv_file_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    existing_rows = list(reader)
-                    existing_headers = reader.fieldnames or []
-
-                # Check if rotation is needed (CSV has grown too large)
-                # Rotation keeps lock hold time bounded by limiting CSV size to 1000 rows
-                # This ensures performance remains acceptable under high concurrent load
-                if len(existing_rows) >= 1000:
-                    # Move current CSV to archive with timestamp for permanent storage
-                    csv_dir = Path(csv_file_path).parent
-                    archive_filename = f"survey_submissions_{timestamp}.csv"
-                    archive_path = csv_dir / archive_filename
-                    Path(csv_file_path).rename(archive_path)
-                    logger.info(
-                        f"CSV pivoté: déplacé {len(existing_rows)} lignes vers {archive_path}"
-                    )
-
-                    # Start fresh with new CSV file
-                    # Reset rows but keep headers to maintain schema consistency
-                    existing_rows = []
-                    row_number = 1
-                else:
-                    row_number = len(existing_rows) + 1
+                # Only the header line is read; the row count comes from the counter file
+                with open(csv_file_path, "r", encoding="utf-8", newline="") as f:
+                    existing_headers = next(csv.reader(f), [])
+                existing_count = _read_csv_row_count(csv_file_path)
             else:
-                row_number = 1
+                existing_count = 0
                 existing_headers = []
 
-            # Compute cropped hash of answers only for duplicate detection
-            # Use first 12 characters of SHA256 hash (sufficient for duplicate detection)
-            # Hash only answers to detect identical survey responses regardless of metadata
-            answers_str = json.dumps(json_data["answers"], sort_keys=True)
-            full_hash = hashlib.sha256(answers_str.encode("utf-8")).hexdigest()
-            cropped_hash = full_hash[:12]
-
-            # Human-readable datetime
-            datetime_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
-
-            # Build row data
-            row_data = {
-                "reference_code": reference_code,
-                "row_number": row_number,
-                "timestamp_unix": timestamp,
-                "datetime": datetime_str,
-            }
-
-            # Add scoring results (dynamic columns based on results dict)
-            # Results dict is created from table data by combining row labels with column headers
-            for key, value in results.items():
-                # Values are already strings from table data, store as-is
-                row_data[key] = str(value)
-
-            # Compute individual hashes for each client_info key for finer-grained duplicate detection
-            # Each client attribute gets its own hash column to allow targeted analysis
-            client_hashes = {}
-            if client_info:
-                for key, value in client_info.items():
-                    try:
-                        # Create deterministic string and hash with reference code as salt
-                        value_str = (
-                            json.dumps(value, sort_keys=True)
-                            if not isinstance(value, str)
-                            else value
-                        )
-                        salted_data = f"{reference_code}:{value_str}"
-                        hash_value = hashlib.sha256(
-                            salted_data.encode("utf-8")
-                        ).hexdigest()[:12]
-                        client_hashes[f"{key}_hash"] = hash_value
-                    except Exception as e:
-                        logger.warning(
-                            f"Échec du hachage de la clé client_info '{key}': {e}"
-                        )
-                        client_hashes[f"{key}_hash"] = "NA"
-
-                logger.debug(
-                    f"Generated {len(client_hashes)} individual client hashes for reference {reference_code}"
-                )
-
-            # Add answers_hash
-            row_data["answers_hash"] = cropped_hash
-
-            # Add all individual client hashes
-            for hash_key, hash_value in client_hashes.items():
-                row_data[hash_key] = hash_value
-
-            logger.debug(
-                f"Données de ligne CSV pour {reference_code}: answers_hash={cropped_hash}, client_hashes={list(client_hashes.keys())}"
-            )
-
             # Determine headers - must include all columns
-            if file_exists and existing_headers:
+            if existing_headers:
                 # Use existing headers but ensure new result keys are appended
                 fieldnames = list(existing_headers)
-                for key in row_data.keys():
-                    if key not in fieldnames:
-                        # Hash keys (answers_hash and client_*_hash) should go at the end
-                        # Scoring result keys should go before answers_hash
-                        if key == "answers_hash" or key.endswith("_hash"):
-                            # Hash keys go at the end
-                            fieldnames.append(key)
-                        elif "answers_hash" in fieldnames:
-                            # Scoring result keys go before answers_hash
-                            hash_idx = fieldnames.index("answers_hash")
-                            fieldnames.insert(hash_idx, key)
-                        else:
-                            # No answers_hash yet, append at end
-                            fieldnames.append(key)
             else:
                 # First time - create header order
                 # Fixed columns first, then scoring results, then hashes
-                fixed_cols = [
-                    "reference_code",
-                    "row_number",
-                    "timestamp_unix",
-                    "datetime",
-                ]
-                scoring_cols = [k for k in results.keys()]
-                hash_cols = ["answers_hash"] + [
-                    k
-                    for k in row_data.keys()
-                    if k.endswith("_hash") and k != "answers_hash"
-                ]
-                fieldnames = fixed_cols + scoring_cols + hash_cols
-
-            # Write to temporary file atomically
-            write_mode = "w"  # Always write mode for atomic operation
-
-            # If we have existing rows, copy them first; otherwise start fresh
-            # This handles both normal appends and post-rotation scenarios
-            if len(existing_rows) > 0:
-                logger.debug(f"Writing {len(existing_rows)} existing rows to CSV")
-                with open(temp_csv, write_mode, encoding="utf-8", newline="") as f:
+                fieldnames = _default_csv_fieldnames(rows[0])
+            for row_data in rows:
+                _merge_csv_fieldnames(fieldnames, row_data)
+
+            # Check if rotation is needed: the CSV has grown too large, or new columns
+            # appeared (a CSV has a single header, so the file would otherwise have to
+            # be rewritten). The new file keeps the extended header
+            if existing_count >= CSV_ROTATION_ROWS or (
+                existing_count > 0 and fieldnames != existing_headers
+            ):
+                # Move current CSV to archive with timestamp for permanent storage
+                archive_path = _archive_csv_log(csv_file_path, timestamp)
+                logger.info(
+                    f"CSV pivoté: déplacé {existing_count} lignes vers {archive_path}"
+                )
+
+                # Start fresh with new CSV file
+                existing_count = 0
+
+            for i, row_data in enumerate(rows):
+                row_data["row_number"] = existing_count + 1 + i
+            row_number = existing_count + len(rows)
+
+            if existing_count > 0:
+                # Common case: same columns, append the new rows in place
+                with open(csv_file_path, "a", encoding="utf-8", newline="") as f:
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    # Write existing rows (ensuring all fields exist)
-                    for existing_row in existing_rows:
-                        # Fill in missing fields with empty string
-                        complete_row = {
-                            field: existing_row.get(field, "") for field in fieldnames
-                        }
-                        writer.writerow(complete_row)
-                    # Write new row
-                    writer.writerow(row_data)
+                    writer.writerows(rows)
             else:
-                # New file or post-rotation - just write header and new row
+                # New file or post-rotation - just write header and new rows
                 logger.debug("Creating new CSV log file")
-                with open(temp_csv, write_mode, encoding="utf-8", newline="") as f:
+                with open(temp_csv, "w", encoding="utf-8", newline="") as f:
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
-                    writer.writerow(row_data)
+                    writer.writerows(rows)
+                # Atomic rename - replaces old file with new one
+                Path(temp_csv).replace(csv_file_path)
 
-            # Atomic rename - replaces old file with new one
-            Path(temp_csv).replace(csv_file_path)
+            _write_csv_row_count(csv_file_path, row_number)
             logger.success(
-                f"Journal CSV mis à jour: ajout de la ligne {row_number} pour la référence {reference_code}"
+                f"Journal CSV mis à jour: ajout de {len(rows)} ligne(s) jusqu'à la ligne {row_number} "
+                f"(références: {', '.join(row['reference_code'] for row in rows)})"
             )
 
     except Timeout:
@@ -323,76 +618,22 @@ def append_to_csv_log(
         fallback_path = csv_dir / fallback_filename
 
         try:
-            # Compute cropped hash of answers only for duplicate detection
-            answers_str = json.dumps(json_data["answers"], sort_keys=True)
-            full_hash = hashlib.sha256(answers_str.encode("utf-8")).hexdigest()
-            cropped_hash = full_hash[:12]
-
-            # Human-readable datetime
-            datetime_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
-
-            # Build row data (same as main path)
-            row_data = {
-                "reference_code": reference_code,
-                "row_number": 1,  # Always 1 for fallback files
-                "timestamp_unix": timestamp,
-                "datetime": datetime_str,
-            }
-
-            # Add scoring results
-            # Values are already strings from table data, store as-is
-            for key, value in results.items():
-                row_data[key] = str(value)
-
-            # Compute individual client hashes
-            client_hashes = {}
-            if client_info:
-                for key, value in client_info.items():
-                    try:
-                        value_str = (
-                            json.dumps(value, sort_keys=True)
-                            if not isinstance(value, str)
-                            else value
-                        )
-                        salted_data = f"{reference_code}:{value_str}"
-                        hash_value = hashlib.sha256(
-                            salted_data.encode("utf-8")
-                        ).hexdigest()[:12]
-                        client_hashes[f"{key}_hash"] = hash_value
-                    except Exception as e:
-                        logger.warning(f"Failed to hash client_info key '{key}': {e}")
-                        client_hashes[f"{key}_hash"] = "NA"
-
-            # Add answers_hash
-            row_data["answers_hash"] = cropped_hash
-
-            # Add all individual client hashes
-            for hash_key, hash_value in client_hashes.items():
-                row_data[hash_key] = hash_value
-
-            # Create fieldnames in consistent order
-            fixed_cols = [
-                "reference_code",
-                "row_number",
-                "timestamp_unix",
-                "datetime",
-            ]
-            scoring_cols = [k for k in results.keys()]
-            hash_cols = ["answers_hash"] + [
-                k
-                for k in row_data.keys()
-                if k.endswith("_hash") and k != "answers_hash"
-            ]
-            fieldnames = fixed_cols + scoring_cols + hash_cols
-
-            # Write fallback CSV with just this row
+            # Same rows as the main path, numbered from 1 in the fallback file
+            for i, row_data in enumerate(rows):
+                row_data["row_number"] = i + 1
+            fieldnames = _default_csv_fieldnames(rows[0])
+            for row_data in rows:
+                _merge_csv_fieldnames(fieldnames, row_data)
+
+            # Write fallback CSV with just these rows
             with open(fallback_path, "w", encoding="utf-8", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerow(row_data)
+                writer.writerows(rows)
 
             logger.success(
-                f"Données sauvegardées dans le CSV de secours: {fallback_path} (référence: {reference_code})"
+                f"Données sauvegardées dans le CSV de secours: {fallback_path} "
+                f"(références: {', '.join(row['reference_code'] for row in rows)})"
             )
 
         except Exception as fallback_error:
@@ -413,6 +654,73 @@ def append_to_csv_log(
         raise
 
 
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Sérialise data en JSON UTF-8, avec orjson s'il est installé, sinon avec json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson is stricter (e.g. integers beyond 64 bits): let json handle it
+            pass
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _queue_submission_archive(
+    json_filepath: Path, data: Dict[str, Any], csv_file_path: str, row_data: Dict
+) -> None:
+    """Met une soumission en attente d'archivage et planifie son écriture en arrière-plan."""
+    with _pending_archives_lock:
+        _pending_archives.append((json_filepath, data, csv_file_path, row_data))
+    ARCHIVE_EXECUTOR.submit(_archive_pending_submissions)
+
+
+def _archive_pending_submissions() -> None:
+    """
+    Sauvegarde le JSON compressé de toutes les soumissions en attente, puis ajoute leurs
+    lignes au journal CSV en une seule écriture par fichier (exécuté dans ARCHIVE_EXECUTOR,
+    les erreurs sont journalisées).
+    """
+    # Take everything queued so far: submissions that arrived while the worker was
+    # busy are written together, and their own tasks then find nothing left to do
+    with _pending_archives_lock:
+        pending = _pending_archives[:]
+        _pending_archives.clear()
+    if not pending:
+        return
+
+    rows_by_csv: Dict[str, List[Dict[str, Any]]] = {}
+    for json_filepath, data, csv_file_path, row_data in pending:
+        try:
+            # Save as compressed JSON
+            # The payload is small: serialize and compress it in memory (fastest gzip
+            # level, level 9 costs several times more CPU for a few bytes), then write
+            # the file in one go to a temporary name renamed into place, so that a
+            # partially written archive is never left under the final name
+            json_bytes = _dump_json_bytes(data)
+            temp_json = json_filepath.with_name(json_filepath.name + ".tmp")
+            temp_json.write_bytes(gzip.compress(json_bytes, compresslevel=1))
+            temp_json.replace(json_filepath)
+
+            logger.success(
+                f"Données JSON compressées sauvegardées dans: {json_filepath}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Échec de la sauvegarde des données JSON {json_filepath}: {str(e)}",
+                exc_info=True,
+            )
+        rows_by_csv.setdefault(csv_file_path, []).append(row_data)
+
+    # Update CSV log with submission data
+    # This is done after JSON save to ensure we have the data files
+    for csv_file_path, rows in rows_by_csv.items():
+        try:
+            _append_rows_to_csv_log(csv_file_path, rows)
+        except Exception as e:
+            # Log error, the PDF doesn't depend on the CSV log
+            logger.error(f"Échec de la mise à jour du journal CSV: {str(e)}")
+
+
 def generate_pdf_report(
     survey_name: str,
     survey_version: str,
@@ -475,7 +783,7 @@ def generate_pdf_report(
     try:
         # Clean up old temporary PDFs before generating new one
         # This ensures temp directory doesn't accumulate files indefinitely
-        cleanup_old_pdfs(TEMP_PDF_DIR, max_age_seconds=3600)
+        cleanup_old_pdfs(settings.temp_pdf_dir, max_age_seconds=3600)
 
         # Only create directories and setup logging if user data saving is enabled
         if settings.save_user_data:
@@ -506,13 +814,11 @@ def generate_pdf_report(
 
         def generate_valid_code_part() -> str:
             """Génère une partie de code de 3 caractères avec au moins une lettre et un chiffre."""
-            while True:
-                part = "".join(random.choices(UNAMBIGUOUS_CHARS, k=3))
-                # Check if part contains at least one letter and one number
-                has_letter = any(c in UNAMBIGUOUS_LETTERS for c in part)
-                has_number = any(c in UNAMBIGUOUS_DIGITS for c in part)
-                if has_letter and has_number:
-                    return part
+            # Draw a letter/digit layout, then each character: no retries needed
+            layout = random.choices(
+                CODE_PART_LAYOUTS, cum_weights=CODE_PART_CUM_WEIGHTS
+            )[0]
+            return "".join(random.choice(chars) for chars in layout)
 
         # Generate both parts of the reference code
         ref_code_part1 = generate_valid_code_part()
@@ -524,30 +830,13 @@ def generate_pdf_report(
 
         # Compute individual hashes for each client_info key for privacy-preserving duplicate detection
         # Each attribute is hashed separately to allow finer-grained analysis
-        client_hashes = {}
+        client_hashes = _hash_client_info(reference_code, client_info)
+        # Hash of the answers only, reused by the CSV log for duplicate detection
+        answers_hash = _hash_answers(answers)
         if client_info:
-            for key, value in client_info.items():
-                try:
-                    # Create deterministic string and hash with reference code as salt
-                    value_str = (
-                        json.dumps(value, sort_keys=True)
-                        if not isinstance(value, str)
-                        else value
-                    )
-                    salted_data = f"{reference_code}:{value_str}"
-                    hash_value = hashlib.sha256(
-                        salted_data.encode("utf-8")
-                    ).hexdigest()[:12]
-                    client_hashes[f"{key}_hash"] = hash_value
-                except Exception as e:
-                    logger.warning(
-                        f"Échec du hachage de la clé client_info '{key}': {e}"
-                    )
-                    client_hashes[f"{key}_hash"] = "NA"
-
-                logger.info(
-                    f"Généré {len(client_hashes)} hachages client individuels pour la référence {reference_code}"
-                )
+            logger.info(
+                f"Généré {len(client_hashes)} hachages client individuels pour la référence {reference_code}"
+            )
         else:
             logger.info(
                 f"Aucun client_info fourni - aucun hachage client ne sera généré pour la référence {reference_code}"
@@ -558,30 +847,13 @@ def generate_pdf_report(
         # Dict format: {"Row1Col1_Header2": "Row1Col2", ...}
         results_dict = {}
         if len(results) > 0:
-            headers = results[0]
+            # Column headers are normalized once, not once per row
+            headers = [h.translate(CSV_KEY_TRANSLATION) for h in results[0]]
             for row in results[1:]:
                 # Create composite keys combining row label (first column) with column headers
-                row_label = (
-                    row[0]
-                    .replace("/", "_")
-                    .replace(" ", "_")
-                    .replace("é", "e")
-                    .replace("è", "e")
-                    .replace("à", "a")
-                    .replace("ô", "o")
-                )
-                for i in range(1, len(row)):
-                    col_header = (
-                        headers[i]
-                        .replace("/", "_")
-                        .replace(" ", "_")
-                        .replace("é", "e")
-                        .replace("è", "e")
-                        .replace("à", "a")
-                        .replace("ô", "o")
-                    )
-                    key = f"{row_label}_{col_header}"
-                    results_dict[key] = row[i]
+                row_label = row[0].translate(CSV_KEY_TRANSLATION)
+                for header, value in zip(headers[1:], row[1:]):
+                    results_dict[f"{row_label}_{header}"] = value
 
         logger.debug(
             f"Converted table data to dict with {len(results_dict)} keys for CSV logging"
@@ -614,30 +886,12 @@ def generate_pdf_report(
                 "client_hashes": client_hashes,
             }
 
-            # Save as compressed JSON
-            with gzip.open(json_filepath, "wt", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
-
-            logger.success(
-                f"Données JSON compressées sauvegardées dans: {json_filepath}"
+            # Archiving doesn't change the report: hand it to the background writer
+            # so the PDF is built right away
+            row_data = _build_row_data(
+                reference_code, 1, timestamp, results_dict, answers_hash, client_hashes
             )
-
-            # Update CSV log with submission data
-            # This is done after JSON save to ensure we have the data file
-            try:
-                append_to_csv_log(
-                    csv_file_path=csv_file_path,
-                    reference_code=reference_code,
-                    timestamp=timestamp,
-                    results=results_dict,  # Use dict format for CSV
-                    json_data=data,
-                    client_info=client_info,
-                )
-            except Exception as e:
-                # Log error but don't fail PDF generation
-                logger.error(
-                    f"Échec de la mise à jour du journal CSV, poursuite avec le PDF: {str(e)}"
-                )
+            _queue_submission_archive(json_filepath, data, str(csv_file_path), row_data)
         else:
             logger.debug(
                 "Sauvegarde des données utilisateur désactivée - omission de la journalisation JSON et CSV"
@@ -652,10 +906,12 @@ def generate_pdf_report(
                 f"Génération du PDF permanent: {pdf_filepath} avec le code de référence: {reference_code}"
             )
         else:
-            # Create temporary PDF in local directory for download only (not permanently saved)
+            # Create temporary PDF for download only (not permanently saved)
             # Old PDFs are cleaned up automatically (see cleanup_old_pdfs above)
-            temp_dir = Path(TEMP_PDF_DIR)
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            # The base directory was made private at startup: the session directory is
+            # (re)created inside it, readable by the current user only
+            temp_dir = Path(settings.temp_pdf_dir)
+            temp_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
 
             pdf_filename = f"survey_{reference_code}_{timestamp}.pdf"
             pdf_filepath = temp_dir / pdf_filename
@@ -666,131 +922,100 @@ def generate_pdf_report(
         # Create PDF using ReportLab with explicit compression enabled
         pdf = SimpleDocTemplate(str(pdf_filepath), pagesize=A4)
         pdf.pageCompression = 1  # Explicitly enable PDF compression
-        story = []  # Container for PDF elements
-        styles = getSampleStyleSheet()
-
-        # Create custom styles
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=16,
-            textColor=colors.HexColor("#000000"),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-        )
-        reference_style = ParagraphStyle(
-            "ReferenceCode",
-            parent=styles["Normal"],
-            fontSize=14,
-            fontName="Helvetica-Bold",
-            textColor=colors.HexColor("#006400"),  # Dark green for emphasis
-            spaceAfter=10,
-            alignment=TA_CENTER,
-        )
-        subtitle_style = ParagraphStyle(
-            "CustomSubtitle",
-            parent=styles["Normal"],
-            fontSize=10,
-            textColor=colors.HexColor("#666666"),
-            spaceAfter=6,
-            fontName="Helvetica-Oblique",
-        )
-        heading_style = ParagraphStyle(
-            "CustomHeading",
-            parent=styles["Heading2"],
-            fontSize=14,
-            spaceAfter=10,
-        )
-        question_style = ParagraphStyle(
-            "Question",
-            parent=styles["Normal"],
-            fontSize=11,
-            fontName="Helvetica-Bold",
-            spaceAfter=4,
-        )
-        answer_style = ParagraphStyle(
-            "Answer",
-            parent=styles["Normal"],
-            fontSize=11,
-            spaceAfter=8,
-        )
-
-        # Title
-        story.append(Paragraph(survey_name, title_style))
-        story.append(Spacer(1, 3 * mm))
-
-        # Reference Code - displayed prominently for patient to memorize
-        story.append(
-            Paragraph(f"<b>Code de référence : {reference_code}</b>", reference_style)
-        )
-        story.append(Spacer(1, 5 * mm))
-
-        # Version information
-        story.append(
-            Paragraph(f"Version du questionnaire : {survey_version}", subtitle_style)
-        )
-        story.append(
-            Paragraph(
-                f"Version PrevMed : {__VERSION__}",
-                subtitle_style,
-            )
-        )
-        story.append(Spacer(1, 3 * mm))
+        # Container for PDF elements, starting with the header built in one go
+        story = [
+            # Title
+            Paragraph(survey_name, _TITLE_STYLE),
+            Spacer(1, 3 * mm),
+            # Reference Code - displayed prominently for patient to memorize
+            Paragraph(f"<b>Code de référence : {reference_code}</b>", _REFERENCE_STYLE),
+            Spacer(1, 5 * mm),
+            # Version information
+            Paragraph(f"Version du questionnaire : {survey_version}", _SUBTITLE_STYLE),
+            Paragraph(_PREVMED_VERSION_LINE, _SUBTITLE_STYLE),
+            Spacer(1, 3 * mm),
+        ]
 
         # Survey URL if provided
         if actual_url:
-            story.append(
-                Paragraph(f"URL du questionnaire : {actual_url}", subtitle_style)
+            story.extend(
+                (
+                    Paragraph(f"URL du questionnaire : {actual_url}", _SUBTITLE_STYLE),
+                    Spacer(1, 3 * mm),
+                )
             )
-            story.append(Spacer(1, 3 * mm))
 
         # Timestamp
-        story.append(
-            Paragraph(
-                f"Généré le : {time.strftime('%d/%m/%Y à %H:%M:%S')}", subtitle_style
+        story.extend(
+            (
+                Paragraph(
+                    f"Généré le : {time.strftime('%d/%m/%Y à %H:%M:%S')}",
+                    _SUBTITLE_STYLE,
+                ),
+                Spacer(1, 10 * mm),
             )
         )
-        story.append(Spacer(1, 10 * mm))
 
         # Scoring Results section - conditionally include based on pdf_options
         # Only add section heading if at least one of markdown or data will be shown
         if include_md or include_data:
-            story.append(Paragraph("Résultats du questionnaire", heading_style))
-            story.append(Spacer(1, 5 * mm))
+            story.extend(
+                (
+                    Paragraph("Résultats du questionnaire", _HEADING_STYLE),
+                    Spacer(1, 5 * mm),
+                )
+            )
 
         # Conditionally include markdown results based on include_md_in_pdf
         if include_md:
-            # Create a custom style for the markdown text
-            # Using Paragraph instead of Preformatted for better cross-viewer compatibility
-            markdown_style = ParagraphStyle(
-                "MarkdownResults",
-                parent=styles["Normal"],
-                fontSize=10,
-                fontName="Courier",
-                textColor=colors.black,
-                backColor=None,  # Explicitly no background
-                leftIndent=10 * mm,
-                spaceAfter=2 * mm,
-            )
-
-            # Render markdown line by line using Paragraph for robust rendering
+            # Render markdown using Paragraph for robust rendering
             # This avoids Preformatted which can have viewer-specific rendering issues
+            # Consecutive non-empty lines share one Paragraph (joined with <br/>) rather
+            # than one flowable per line, which keeps the story short for long results
             # Wrap text in explicit color tags to ensure black text in all PDF viewers (including Okular)
-            for line in markdown_result.split("\n"):
-                if line.strip():
-                    # Escape HTML special characters manually
-                    safe_line = (
-                        line.replace("&", "&amp;")
-                        .replace("<", "&lt;")
-                        .replace(">", "&gt;")
-                    )
-                    # Wrap in explicit font color tag for maximum PDF viewer compatibility
+            block = []
+
+            def flush_block() -> None:
+                if block:
                     # This ensures text renders as black even in viewers like Okular that may ignore style textColor
-                    colored_line = f'<font color="black">{safe_line}</font>'
-                    story.append(Paragraph(colored_line, markdown_style))
-                else:
+                    story.append(
+                        Paragraph(
+                            f'<font color="black">{"<br/>".join(block)}</font>',
+                            _MARKDOWN_STYLE,
+                        )
+                    )
+                    block.clear()
+
+            # Widest line sure to fit on one row: the frame width less its 6pt side
+            # paddings and the indent (the escaped text is never narrower than the
+            # rendered one, so measuring it can only overestimate)
+            max_row_width = pdf.width - 12 - _MARKDOWN_STYLE.leftIndent
+
+            # Escape HTML special characters (&, <, >), once for the whole text
+            safe_markdown = _escape_markup(markdown_result)
+            for line in safe_markdown.split("\n"):
+                if not line.strip():
+                    flush_block()
                     # Empty line - add small spacer to preserve structure
                     story.append(Spacer(1, 2 * mm))
+                elif (
+                    stringWidth(
+                        line, _MARKDOWN_STYLE.fontName, _MARKDOWN_STYLE.fontSize
+                    )
+                    > max_row_width
+                ):
+                    # A line that may wrap gets its own Paragraph, so that its rows are
+                    # not spread apart by the block leading
+                    flush_block()
+                    story.append(
+                        Paragraph(
+                            f'<font color="black">{line}</font>',
+                            _MARKDOWN_WRAPPED_STYLE,
+                        )
+                    )
+                else:
+                    block.append(line)
+            flush_block()
 
             story.append(Spacer(1, 3 * mm))
 
@@ -807,30 +1032,20 @@ def generate_pdf_report(
             col_width = available_width / num_cols
             col_widths = [col_width] * num_cols
 
-            # Create and style the results table
-            results_table = Table(results_data, colWidths=col_widths)
-            results_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 11),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 1), (-1, -1), 11),
-                    ]
-                )
+            # Create the results table, styled at construction
+            results_table = Table(
+                results_data, colWidths=col_widths, style=_RESULTS_TABLE_STYLE
             )
             story.append(results_table)
 
         # Questions and Answers section
-        story.append(Spacer(1, 10 * mm))
-        story.append(Paragraph("Réponses au questionnaire", heading_style))
-        story.append(Spacer(1, 5 * mm))
+        story.extend(
+            (
+                Spacer(1, 10 * mm),
+                Paragraph("Réponses au questionnaire", _HEADING_STYLE),
+                Spacer(1, 5 * mm),
+            )
+        )
 
         for iq, q in enumerate(questions):
             var_name = q["variable"]
@@ -838,18 +1053,22 @@ def generate_pdf_report(
 
             # Question text - show ALL questions regardless of whether they were answered
             question_text = f"Q{iq + 1}: {q['question']}"
-            story.append(Paragraph(question_text, question_style))
 
             # Answer formatting - handle all value types including None
+            # Free-text answers are escaped so that they are never read as markup
             if isinstance(answer, bool):
                 answer_text = f"R : {'Oui' if answer else 'Non'}"
             elif answer is None:
                 answer_text = "R : Non répondu"
             else:
-                answer_text = f"R : {answer}"
+                answer_text = f"R : {_escape_markup(str(answer))}"
 
-            story.append(Paragraph(answer_text, answer_style))
-            story.append(Spacer(1, 3 * mm))
+            story.extend(
+                (
+                    Paragraph(question_text, _QUESTION_STYLE),
+                    Paragraph(answer_text, _ANSWER_STYLE),
+                )
+            )
 
         # Build the PDF
         logger.debug("Construction du document PDF")
@@ -860,8 +1079,9 @@ def generate_pdf_report(
 
         if settings.save_user_data:
             logger.success(f"Rapport PDF permanent sauvegardé: {pdf_filepath}")
+            # The archive is written in the background, which logs the actual outcome
             logger.info(
-                f"Données permanentes sauvegardées en JSON compressé: {json_filepath}"
+                f"Données permanentes mises en file d'attente pour sauvegarde en JSON compressé: {json_filepath}"
             )
         else:
             logger.success(f"Rapport PDF temporaire généré: {pdf_filepath}")
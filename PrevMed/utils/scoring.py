@@ -1,5 +1,62 @@
+import functools
 from loguru import logger
-from typing import Dict, Any
+from typing import Any, Callable, Dict
+
+
+@functools.lru_cache(maxsize=8)
+def _load_r_scoring(code: str) -> Any:
+    """
+    Évalue le code R une seule fois et retourne la fonction R 'scoring' qu'il définit.
+
+    Paramètres
+    ----------
+    code : str
+        Code R définissant une fonction 'scoring'
+
+    Retourne
+    --------
+    rpy2.robjects.functions.Function
+        Fonction R 'scoring', réutilisée pour tous les appels avec le même code
+    """
+    import rpy2.robjects as ro
+
+    logger.debug("Exécution du code R pour définir la fonction")
+    # Execute the R code to define the function
+    ro.r(code)
+    return ro.r["scoring"]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_python_scoring(code: str) -> Callable[..., Any]:
+    """
+    Exécute le code Python une seule fois et retourne la fonction 'scoring' qu'il définit.
+
+    Paramètres
+    ----------
+    code : str
+        Code Python définissant une fonction 'scoring'
+
+    Retourne
+    --------
+    Callable[..., Any]
+        Fonction 'scoring', réutilisée pour tous les appels avec le même code
+
+    Lève
+    ----
+    ValueError
+        Si le code ne définit pas de fonction 'scoring'
+    """
+    logger.debug("Exécution du code Python pour définir la fonction")
+    # Create namespace and execute code
+    namespace = {}
+    exec(code, namespace)
+
+    # Find the scoring function (must be named 'scoring')
+    func_name = "scoring"
+    if func_name not in namespace:
+        logger.error(f"Fonction '{func_name}' introuvable dans le code de scoring")
+        raise ValueError(f"Fonction '{func_name}' introuvable dans le code de scoring")
+    return namespace[func_name]
 
 
 def execute_scoring_r(
@@ -37,27 +94,20 @@ def execute_scoring_r(
     # Use localconverter to ensure conversion rules are available in threaded context
     # This fixes the ContextVar issue when running in Gradio's event handlers
     with localconverter(default_converter):
-        logger.debug("Exécution du code R pour définir la fonction")
-        # Execute the R code to define the function
-        ro.r(code)
+        # The script is only evaluated on the first call with this code
+        scoring_fn = _load_r_scoring(code)
 
         logger.debug("Conversion des entrées Python en objets R")
         # Convert Python inputs to R arguments
-        # Handle None values and type conversions
-        r_inputs = {}
-        for key, value in inputs.items():
-            if value is None:
-                r_inputs[key] = ro.NULL
-            elif isinstance(value, bool):
-                r_inputs[key] = ro.BoolVector([value])[0]
-            elif isinstance(value, str):
-                r_inputs[key] = ro.StrVector([value])[0]
-            else:
-                r_inputs[key] = value
+        # Only None needs an explicit value: the default converter turns bool, str
+        # and numeric scalars into R vectors when the function is called
+        r_inputs = {
+            key: ro.NULL if value is None else value for key, value in inputs.items()
+        }
 
         logger.debug("Appel de la fonction R 'scoring'")
         # Call the R function - expects it to return a named list
-        result = ro.r["scoring"](**r_inputs)
+        result = scoring_fn(**r_inputs)
 
         logger.debug("Conversion du résultat R en tuple Python")
         # R function should return a list with 3 elements:
@@ -126,22 +176,12 @@ def execute_scoring_python(
     logger.info("Début de l'exécution du scoring Python")
 
     try:
-        logger.debug("Exécution du code Python pour définir la fonction")
-        # Create namespace and execute code
-        namespace = {}
-        exec(code, namespace)
-
-        # Find the scoring function (must be named 'scoring')
-        func_name = "scoring"
-        if func_name not in namespace:
-            logger.error(f"Fonction '{func_name}' introuvable dans le code de scoring")
-            raise ValueError(
-                f"Fonction '{func_name}' introuvable dans le code de scoring"
-            )
+        # The script is only executed on the first call with this code
+        scoring_fn = _load_python_scoring(code)
 
-        logger.debug(f"Appel de la fonction Python {func_name}")
+        logger.debug("Appel de la fonction Python scoring")
         # Call the function with inputs
-        result = namespace[func_name](**inputs)
+        result = scoring_fn(**inputs)
 
         # Ensure result is a 3-tuple
         if not isinstance(result, tuple) or len(result) != 3:
@@ -195,6 +235,13 @@ def execute_scoring_python(
         ) from e
 
 
+# Scoring function of each supported language
+_SCORING_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "r": execute_scoring_r,
+    "python": execute_scoring_python,
+}
+
+
 def execute_scoring(
     language: str, code: str, inputs: Dict[str, Any]
 ) -> tuple[str, list[list[str]], dict[str, bool]]:
@@ -219,10 +266,8 @@ def execute_scoring(
     """
     logger.info(f"Exécution du scoring avec le langage: {language}")
 
-    if language == "r":
-        return execute_scoring_r(code, inputs)
-    elif language == "python":
-        return execute_scoring_python(code, inputs)
-    else:
+    scoring_fn = _SCORING_FUNCTIONS.get(language)
+    if scoring_fn is None:
         logger.error(f"Langage de scoring non supporté: {language}")
         raise ValueError(f"Langage de scoring non supporté: {language}")
+    return scoring_fn(code, inputs)
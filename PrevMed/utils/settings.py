@@ -5,6 +5,9 @@ Fournit un objet de configuration centralisé accessible depuis tous les modules
 Les paramètres sont remplis par les arguments CLI et utilisés dans toute l'application.
 """
 
+import os
+import tempfile
+
 
 class Settings:
     """
@@ -17,10 +20,23 @@ class Settings:
         (logs CSV, données JSON et rapports PDF).
         Si False, seuls des PDF temporaires sont créés pour le téléchargement sans
         enregistrer aucune donnée.
+    cache_dir : str ou None
+        Répertoire du cache disque des fichiers de configuration (YAML et script de
+        scoring). Si None, le cache est désactivé.
+    temp_pdf_dir : str
+        Répertoire des PDF temporaires créés pour le téléchargement. Par défaut dans le
+        répertoire temporaire du système (généralement un tmpfs sous Linux) afin que
+        ces fichiers éphémères ne soient jamais écrits sur un disque persistant.
     """
 
+    # Fixed set of attributes: faster access than through an instance __dict__, and
+    # assigning a misspelt setting raises AttributeError instead of being ignored
+    __slots__ = ("save_user_data", "cache_dir", "temp_pdf_dir")
+
     def __init__(self):
         self.save_user_data: bool = False
+        self.cache_dir: str | None = None
+        self.temp_pdf_dir: str = os.path.join(tempfile.gettempdir(), "prevmed-pdfs")
 
 
 # Instance globale des paramètres accessible depuis n'importe quel module
@@ -17,6 +17,11 @@ Design decisions:
 import math
 from typing import Optional, Dict, List, Tuple, Any
 
+# First letters of the male answers ("M"/"Male"/"Homme") and spellings of "Oui",
+# checked by set membership instead of lowercasing the answer on every call
+_MALE_PREFIX = frozenset(("m", "h", "M", "H"))
+_OUI = frozenset(("oui", "Oui", "OUI"))
+
 
 def compute_premm5_from_data(
     sex: str,
@@ -85,14 +90,12 @@ def compute_premm5_from_data(
     # Convert string responses to boolean for easier logic handling
     # YAML passes "Oui"/"Non" but we need True/False for Python logic
     # None values (from skipped questions) are treated as False
-    personal_ec_bool = personal_ec is not None and str(personal_ec).lower() == "oui"
-    personal_other_ls_bool = (
-        personal_other_ls is not None and str(personal_other_ls).lower() == "oui"
-    )
+    personal_ec_bool = personal_ec in _OUI
+    personal_other_ls_bool = personal_other_ls in _OUI
 
     # --- V0-V4: Individual cancer indicators ---
     # V0: Sex indicator (1 for male, 0 for female)
-    V0 = 1 if str(sex).lower()[0] in ["m", "h"] else 0
+    V0 = 1 if sex and sex[0] in _MALE_PREFIX else 0
     # V1: Exactly 1 CRC
     V1 = int(personal_crc_count == 1)
     # V2: 2 or more CRCs
@@ -208,8 +211,12 @@ def compute_premm5_from_data(
 
     # --- Softmax transformation to get probabilities ---
     # Convert linear predictors to probabilities using multinomial logit
-    e = [math.exp(lp) for lp in [lp_MLH1, lp_MSH2, lp_MSH6, lp_PMS2]]
-    denom = 1 + sum(e)
+    # Predictors are shifted by their maximum (and 0, the reference category) so
+    # exp never overflows and the largest term is exactly 1 (log-sum-exp trick)
+    lps = (lp_MLH1, lp_MSH2, lp_MSH6, lp_PMS2)
+    m = max(0.0, *lps)
+    e = [math.exp(lp - m) for lp in lps]
+    denom = math.exp(-m) + sum(e)
     probs = [exp_val / denom for exp_val in e]
 
     # --- Return as dictionary ---
@@ -318,28 +325,36 @@ def scoring(
         age_ec_sdr=age_ec_sdr,
     )
 
+    # Format each percentage once, reused by the markdown and the table data
+    mlh1, msh2, msh6, pms2, p_any, p_none = (
+        f"{results[key] * 100:05.2f}%"
+        for key in ("p_MLH1", "p_MSH2_EPCAM", "p_MSH6", "p_PMS2", "p_any", "p_none")
+    )
+
     # Format results as markdown table
-    markdown = "## Résultats du scoring\n\n"
-    markdown += "| Gène/Catégorie | Probabilité |\n"
-    markdown += "|---------------|-------------|\n"
-    markdown += f"| MLH1 | {results['p_MLH1'] * 100:05.2f}% |\n"
-    markdown += f"| MSH2/EPCAM | {results['p_MSH2_EPCAM'] * 100:05.2f}% |\n"
-    markdown += f"| MSH6 | {results['p_MSH6'] * 100:05.2f}% |\n"
-    markdown += f"| PMS2 | {results['p_PMS2'] * 100:05.2f}% |\n"
-    markdown += f"| **Total (any)** | **{results['p_any'] * 100:05.2f}%** |\n"
-    markdown += f"| None | {results['p_none'] * 100:05.2f}% |\n"
+    markdown = (
+        "## Résultats du scoring\n\n"
+        "| Gène/Catégorie | Probabilité |\n"
+        "|---------------|-------------|\n"
+        f"| MLH1 | {mlh1} |\n"
+        f"| MSH2/EPCAM | {msh2} |\n"
+        f"| MSH6 | {msh6} |\n"
+        f"| PMS2 | {pms2} |\n"
+        f"| **Total (any)** | **{p_any}** |\n"
+        f"| None | {p_none} |\n"
+    )
 
     # Return tuple with 3 elements: markdown string, table data, and PDF options
     # Table data is a list where first element is headers, rest are data rows
     # This allows for flexible n-column tables instead of just 2-column key-value pairs
     table_data = [
         ["Gène/Catégorie", "Probabilité"],  # Headers
-        ["MLH1", f"{results['p_MLH1'] * 100:05.2f}%"],
-        ["MSH2/EPCAM", f"{results['p_MSH2_EPCAM'] * 100:05.2f}%"],
-        ["MSH6", f"{results['p_MSH6'] * 100:05.2f}%"],
-        ["PMS2", f"{results['p_PMS2'] * 100:05.2f}%"],
-        ["Total (any)", f"{results['p_any'] * 100:05.2f}%"],
-        ["None", f"{results['p_none'] * 100:05.2f}%"],
+        ["MLH1", mlh1],
+        ["MSH2/EPCAM", msh2],
+        ["MSH6", msh6],
+        ["PMS2", pms2],
+        ["Total (any)", p_any],
+        ["None", p_none],
     ]
 
     # PDF generation options control what gets included in the PDF report